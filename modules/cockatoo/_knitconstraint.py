@@ -9,15 +9,11 @@ __all__ = [
 ]
 
 # LOCAL MODULE IMPORTS --------------------------------------------------------
-from cockatoo.environment import RHINOINSIDE
+from cockatoo.environment import RHINOINSIDE  # NOQA: F401
 
 # RHINO IMPORTS ---------------------------------------------------------------
-if RHINOINSIDE:
-    import rhinoinside
-    rhinoinside.load()
-    from Rhino.Geometry import Curve as RhinoCurve
-else:
-    from Rhino.Geometry import Curve as RhinoCurve
+# rhinoinside has already been loaded by cockatoo.environment if needed
+from Rhino.Geometry import Curve as RhinoCurve
 
 # CLASS DECLARATION -----------------------------------------------------------
 
@@ -12,9 +12,10 @@ __all__ = [
 
 # LOCAL MODULE IMPORTS --------------------------------------------------------
 from cockatoo._knitnetworkbase import KnitNetworkBase
-from cockatoo.environment import RHINOINSIDE
+from cockatoo.environment import RHINOINSIDE  # NOQA: F401
 from cockatoo.exception import KnitNetworkTopologyError
-from cockatoo.utilities import is_ccw_xy
+from cockatoo.utilities import is_ccw_xy_colinear
+from cockatoo.utilities import is_ccw_xy_strict
 from cockatoo.utilities import pairwise
 from cockatoo.utilities import tween_planes
 
@@ -22,20 +23,12 @@ from cockatoo.utilities import tween_planes
 import networkx as nx
 
 # RHINO IMPORTS ---------------------------------------------------------------
-if RHINOINSIDE:
-    import rhinoinside
-    rhinoinside.load()
-    from Rhino.Geometry import Mesh as RhinoMesh
-    from Rhino.Geometry import MeshNgon as RhinoMeshNgon
-    from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
-    from Rhino.Geometry import Plane as RhinoPlane
-    from Rhino.Geometry import Vector3d as RhinoVector3d
-else:
-    from Rhino.Geometry import Mesh as RhinoMesh
-    from Rhino.Geometry import MeshNgon as RhinoMeshNgon
-    from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
-    from Rhino.Geometry import Plane as RhinoPlane
-    from Rhino.Geometry import Vector3d as RhinoVector3d
+# rhinoinside has already been loaded by cockatoo.environment if needed
+from Rhino.Geometry import Mesh as RhinoMesh
+from Rhino.Geometry import MeshNgon as RhinoMeshNgon
+from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
+from Rhino.Geometry import Plane as RhinoPlane
+from Rhino.Geometry import Vector3d as RhinoVector3d
 
 # CLASS DECLARATION -----------------------------------------------------------
 
@@ -99,6 +92,57 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         else:
             self.halfedge = {}
 
+    # NODE INDEX --------------------------------------------------------------
+
+    # networkx.DiGraph precedes KnitNetworkBase in the method resolution order
+    # and overrides the node mutators of networkx.Graph, so the node index has
+    # to be invalidated here as well
+
+    def add_node(self, n, attr_dict=None, **attr):
+        """
+        Adds a single node to the network and invalidates the node index.
+        See :meth:`networkx.DiGraph.add_node` for details.
+        """
+
+        super(KnitDiNetwork, self).add_node(n, attr_dict=attr_dict, **attr)
+        self._invalidate_node_index()
+
+    def add_nodes_from(self, nodes, **attr):
+        """
+        Adds multiple nodes to the network and invalidates the node index.
+        See :meth:`networkx.DiGraph.add_nodes_from` for details.
+        """
+
+        super(KnitDiNetwork, self).add_nodes_from(nodes, **attr)
+        self._invalidate_node_index()
+
+    def remove_node(self, n):
+        """
+        Removes a single node from the network and invalidates the node index.
+        See :meth:`networkx.DiGraph.remove_node` for details.
+        """
+
+        super(KnitDiNetwork, self).remove_node(n)
+        self._invalidate_node_index()
+
+    def remove_nodes_from(self, nodes):
+        """
+        Removes multiple nodes from the network and invalidates the node
+        index. See :meth:`networkx.DiGraph.remove_nodes_from` for details.
+        """
+
+        super(KnitDiNetwork, self).remove_nodes_from(nodes)
+        self._invalidate_node_index()
+
+    def clear(self):
+        """
+        Removes all nodes and edges from the network and invalidates the node
+        index. See :meth:`networkx.DiGraph.clear` for details.
+        """
+
+        super(KnitDiNetwork, self).clear()
+        self._invalidate_node_index()
+
     # TEXTUAL REPRESENTATION OF NETWORK ---------------------------------------
 
     def __repr__(self):
@@ -116,10 +160,8 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         else:
             name = "KnitDiNetwork"
 
-        nn = len(self.nodes())
-        ce = len(self.contour_edges)
-        wee = len(self.weft_edges)
-        wae = len(self.warp_edges)
+        nn = self.number_of_nodes()
+        ce, wee, wae = self._count_edge_types()
         data = ("({} Nodes, {} Segment Contours, {} Weft, {} Warp)")
         data = data.format(nn, ce, wee, wae)
 
@@ -164,13 +206,11 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of outgoing 'weft' edges.
         """
 
-        weft_edges = [e for e in
-                      self.edges_iter(node, data=True) if e[2]["weft"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return weft_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["weft"]]
         else:
-            return [(e[0], e[1]) for e in weft_edges]
+            return [(s, e) for s, e, d in edges_iter if d["weft"]]
 
     def node_weft_edges_in(self, node, data=False):
         """
@@ -193,13 +233,11 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming 'weft' edges.
         """
 
-        weft_edges = [e for e in
-                      self.in_edges_iter(node, data=True) if e[2]["weft"]]
-
+        edges_iter = self.in_edges_iter(node, data=True)
         if data:
-            return weft_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["weft"]]
         else:
-            return [(e[0], e[1]) for e in weft_edges]
+            return [(s, e) for s, e, d in edges_iter if d["weft"]]
 
     def node_weft_edges(self, node, data=False):
         """
@@ -223,15 +261,19 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming and outgoing 'weft' edges.
         """
 
-        weft_edges = [e for e in
-                      self.edges_iter(node, data=True) if e[2]["weft"]]
-        weft_edges.extend(e for e in
-                          self.in_edges_iter(node, data=True) if e[2]["weft"])
-
+        # read the adjacency of the node directly instead of going through
+        # the generic edge iterators
+        succ = self.succ[node]
+        pred = self.pred[node]
         if data:
-            return weft_edges
+            weft_edges = [(node, v, d) for v, d in succ.items() if d["weft"]]
+            weft_edges.extend((u, node, d) for u, d in pred.items()
+                              if d["weft"])
         else:
-            return [(e[0], e[1]) for e in weft_edges]
+            weft_edges = [(node, v) for v, d in succ.items() if d["weft"]]
+            weft_edges.extend((u, node) for u, d in pred.items()
+                              if d["weft"])
+        return weft_edges
 
     # NODE WARP EDGE METHODS --------------------------------------------------
 
@@ -256,13 +298,11 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of outgoing 'warp' edges.
         """
 
-        warp_edges = [e for e in
-                      self.edges_iter(node, data=True) if e[2]["warp"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return warp_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["warp"]]
         else:
-            return [(e[0], e[1]) for e in warp_edges]
+            return [(s, e) for s, e, d in edges_iter if d["warp"]]
 
     def node_warp_edges_in(self, node, data=False):
         """
@@ -285,13 +325,11 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming 'warp' edges.
         """
 
-        warp_edges = [e for e in
-                      self.in_edges_iter(node, data=True) if e[2]["warp"]]
-
+        edges_iter = self.in_edges_iter(node, data=True)
         if data:
-            return warp_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["warp"]]
         else:
-            return [(e[0], e[1]) for e in warp_edges]
+            return [(s, e) for s, e, d in edges_iter if d["warp"]]
 
     def node_warp_edges(self, node, data=False):
         """
@@ -316,15 +354,19 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming and outgoing 'warp' edges.
         """
 
-        warp_edges = [e for e in
-                      self.edges_iter(node, data=True) if e[2]["warp"]]
-        warp_edges.extend(e for e in
-                          self.in_edges_iter(node, data=True) if e[2]["warp"])
-
+        # read the adjacency of the node directly instead of going through
+        # the generic edge iterators
+        succ = self.succ[node]
+        pred = self.pred[node]
         if data:
-            return warp_edges
+            warp_edges = [(node, v, d) for v, d in succ.items() if d["warp"]]
+            warp_edges.extend((u, node, d) for u, d in pred.items()
+                              if d["warp"])
         else:
-            return [(e[0], e[1]) for e in warp_edges]
+            warp_edges = [(node, v) for v, d in succ.items() if d["warp"]]
+            warp_edges.extend((u, node) for u, d in pred.items()
+                              if d["warp"])
+        return warp_edges
 
     # NODE CONTOUR EDGE METHODS -----------------------------------------------
 
@@ -351,14 +393,13 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of outgoing edges neither 'weft' nor 'warp'.
         """
 
-        contour_edges = [(s, e, d) for s, e, d in
-                         self.edges_iter(node, data=True)
-                         if not d["warp"] and not d["weft"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return contour_edges
+            return [(s, e, d) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
         else:
-            return [(e[0], e[1]) for e in contour_edges]
+            return [(s, e) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
 
     def node_contour_edges_in(self, node, data=False):
         """
@@ -383,14 +424,13 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming edges neither 'weft' nor 'warp'.
         """
 
-        contour_edges = [(s, e, d) for s, e, d in
-                         self.in_edges_iter(node, data=True)
-                         if not d["warp"] and not d["weft"]]
-
+        edges_iter = self.in_edges_iter(node, data=True)
         if data:
-            return contour_edges
+            return [(s, e, d) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
         else:
-            return [(e[0], e[1]) for e in contour_edges]
+            return [(s, e) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
 
     def node_contour_edges(self, node, data=False):
         """
@@ -415,17 +455,21 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             List of incoming and outgoing edges neither 'weft' nor 'warp'.
         """
 
-        contour_edges = [(s, e, d) for s, e, d in
-                         self.edges_iter(node, data=True)
-                         if not d["warp"] and not d["weft"]]
-        contour_edges.extend([(s, e, d) for s, e, d in
-                              self.in_edges_iter(node, data=True)
-                              if not d["warp"] and not d["weft"]])
-
+        # read the adjacency of the node directly instead of going through
+        # the generic edge iterators
+        succ = self.succ[node]
+        pred = self.pred[node]
         if data:
-            return contour_edges
+            contour_edges = [(node, v, d) for v, d in succ.items()
+                             if not d["warp"] and not d["weft"]]
+            contour_edges.extend((u, node, d) for u, d in pred.items()
+                                 if not d["warp"] and not d["weft"])
         else:
-            return [(e[0], e[1]) for e in contour_edges]
+            contour_edges = [(node, v) for v, d in succ.items()
+                             if not d["warp"] and not d["weft"]]
+            contour_edges.extend((u, node) for u, d in pred.items()
+                                 if not d["warp"] and not d["weft"])
+        return contour_edges
 
     # FIND FACES (CYCLES) OF NETWORK ------------------------------------------
 
@@ -543,7 +587,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             c = xyz[nbr]
             pos = 0
             b = xyz[ordered_nbrs[pos]]
-            while not is_ccw_xy(a, b, c):
+            while not is_ccw_xy_strict(a, b, c):
                 pos += 1
                 if pos > i:
                     break
@@ -551,7 +595,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             if pos == 0:
                 pos -= 1
                 b = xyz[ordered_nbrs[pos]]
-                while is_ccw_xy(a, b, c):
+                while is_ccw_xy_strict(a, b, c):
                     pos -= 1
                     if pos < -len(ordered_nbrs):
                         break
@@ -668,7 +712,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             ac = [c[0] - a[0], c[1] - a[1], 0]
             rhino_ac = RhinoVector3d(*ac)
             alpha = RhinoVector3d.VectorAngle(rhino_ab, rhino_ac)
-            if is_ccw_xy(a, b, c, True):
+            if is_ccw_xy_colinear(a, b, c):
                 alpha = (2 * math.pi) - alpha
             angles.append(alpha)
 
@@ -1029,8 +1073,16 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         # initialize mapping dicts for ordering of rows and columns
         id2row = OrderedDict()
         id2col = OrderedDict()
-        node2rowid = OrderedDict()
-        node2colid = OrderedDict()
+        # node to row / column lookups are never iterated, plain dicts suffice
+        node2rowid = {}
+        node2colid = {}
+
+        # bind frequently used lookups once for the traversal loops
+        node_data = self.node
+        node_weft_edges_out = self.node_weft_edges_out
+        node_weft_edges_in = self.node_weft_edges_in
+        node_warp_edges_out = self.node_warp_edges_out
+        node_warp_edges_in = self.node_warp_edges_in
 
         # BUILD ROWS ----------------------------------------------------------
 
@@ -1042,8 +1094,8 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                 continue
 
             # get outgoing 'weft' edges of the current 'end' node
-            nodeweft_out = self.node_weft_edges_out(node, data=True)
-            nodeweft_in = self.node_weft_edges_in(node, data=True)
+            nodeweft_out = node_weft_edges_out(node, data=True)
+            nodeweft_in = node_weft_edges_in(node, data=True)
 
             # skip 'end' nodes which have only incoming 'weft' edges
             if nodeweft_in and not nodeweft_out:
@@ -1069,14 +1121,15 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             elif len(nodeweft_out) == 1:
                 # get the connected node to the current node
                 connected_node = (nodeweft_out[0][1],
-                                  self.node[nodeweft_out[0][1]])
+                                  node_data[nodeweft_out[0][1]])
                 # define initial row nodes with nodes of the first edge
                 row_nodes = [node, connected_node[0]]
                 # traverse as long as there is an outgoing next 'weft' edge
                 # until an 'end' node is discovered
                 while True:
                     # get 'weft' edges of last node in row nodes
-                    next_weft = self.node_weft_edges_out(row_nodes[-1])
+                    last = row_nodes[-1]
+                    next_weft = node_weft_edges_out(last)
                     # if there is more than one connected 'weft' edge, we
                     # have a problem
                     if len(next_weft) > 1:
@@ -1085,18 +1138,18 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                         raise KnitNetworkTopologyError(errMsg)
                     # if there are no next 'weft' edges, row is complete
                     elif len(next_weft) == 0:
-                        if self.node[row_nodes[-1]]["end"]:
+                        if node_data[last]["end"]:
                             # this is the finishing 'end' node; set it seen
                             # and complete this row by breaking
-                            seenrows[row_nodes[-1]] = True
+                            seenrows[last] = True
                             break
                         # if there are no next 'weft' edges but this is not
                         # an 'end' node, we have a problem
                         else:
                             # see if there are incoming 'weft' edges at the
                             # current node which are not the way we came from
-                            next_weft = [nw for nw in self.node_weft_edges_in(
-                                         row_nodes[-1], data=True)
+                            next_weft = [nw for nw in node_weft_edges_in(
+                                         last, data=True)
                                          if nw[0] != row_nodes[-2]]
 
                             # try to reverse them as a failsafe for imperfect
@@ -1113,7 +1166,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                             else:
                                 errMsg = ("Unexpected end of row. Missing " +
                                           "'end' attribute at node {}!")
-                                errMsg.format(row_nodes[-1])
+                                errMsg.format(last)
                                 raise KnitNetworkTopologyError(errMsg)
 
                     # if there is a next node over a 'weft' edge, append to
@@ -1142,8 +1195,8 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                 continue
 
             # get outgoing 'warp' edges of the current node
-            nodewarp_out = self.node_warp_edges_out(node, data=True)
-            nodewarp_in = self.node_warp_edges_in(node, data=True)
+            nodewarp_out = node_warp_edges_out(node, data=True)
+            nodewarp_in = node_warp_edges_in(node, data=True)
 
             # skip nodes which have incoming 'warp' edges
             if nodewarp_in:
@@ -1173,13 +1226,13 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
             elif len(nodewarp_out) == 1:
                 # get the connected node to the current node
                 connected_node = (nodewarp_out[0][1],
-                                  self.node[nodewarp_out[0][1]])
+                                  node_data[nodewarp_out[0][1]])
                 # define initial column nodes with nodes of the first edge
                 col_nodes = [node, connected_node[0]]
                 # traverse as long as there is an outgoing next 'warp' edge
                 while True:
                     # get 'warp' edges of last node in row nodes
-                    next_warp = self.node_warp_edges_out(col_nodes[-1])
+                    next_warp = node_warp_edges_out(col_nodes[-1])
                     # if there is more than one connected 'warp' edge, we
                     # have a problem
                     if len(next_warp) > 1:
@@ -1214,24 +1267,27 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         for row_id in row_ids:
             # get row from mapping dict
             row = id2row[row_id]
-            # initialize list for storage of targets
+            # initialize list for storage of targets and a set for fast
+            # membership tests
             target_ids = []
+            seen_targets = set()
             # loop over all nodes in the current row
             for node in row:
                 # check the node for outgoing 'warp' edges and get its
                 # successor
                 try:
-                    node_suc = self.node_warp_edges_out(node)[0][1]
+                    node_suc = node_warp_edges_out(node)[0][1]
                 except IndexError:
                     continue
                 # find the id of the row which contains the 'warp' edge
                 # successor node
                 target_id = node2rowid[node_suc]
                 # if we already found this id before, continue
-                if target_id in target_ids:
+                if target_id in seen_targets:
                     continue
                 # if its a new id, append it to the list of found target ids
                 target_ids.append(target_id)
+                seen_targets.add(target_id)
 
             [row_map.add_edge(row_id, tid) for tid in target_ids]
 
@@ -1245,24 +1301,27 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         for col_id in col_ids:
             # get column from mapping dict
             col = id2col[col_id]
-            # initialize list for storage of targets
+            # initialize list for storage of targets and a set for fast
+            # membership tests
             target_ids = []
+            seen_targets = set()
             # loop over all nodes in the current column
             for node in col:
                 # check the node for outgoing 'weft' edges and get its
                 # successor
                 try:
-                    node_suc = self.node_weft_edges_out(node)[0][1]
+                    node_suc = node_weft_edges_out(node)[0][1]
                 except IndexError:
                     continue
                 # find the id of the column which contains the 'weft' edge
                 # successor node
                 target_id = node2colid[node_suc]
                 # if we already found this id before, continue
-                if target_id in target_ids:
+                if target_id in seen_targets:
                     continue
                 # if its a new id, append it to the list of found target ids
                 target_ids.append(target_id)
+                seen_targets.add(target_id)
 
             [col_map.add_edge(col_id, tid) for tid in target_ids]
 
@@ -1283,7 +1342,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
         toposort_rows = [id2row[id] for id in ordered_row_ids]
         for i, row in enumerate(toposort_rows):
             for n in row:
-                self.node[n]["chain"] = i
+                node_data[n]["chain"] = i
 
         if consolidate:
             # HORIZONTAL CONSOLIDATION ----------------------------------------
@@ -1300,7 +1359,7 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                 for prevrow in prevrows:
                     row_found = False
                     for node in row:
-                        warp_in = self.node_warp_edges_in(node)
+                        warp_in = node_warp_edges_in(node)
                         if warp_in:
                             if warp_in[0][0] not in prevrow:
                                 continue
@@ -1323,9 +1382,11 @@ class KnitDiNetwork(nx.DiGraph, KnitNetworkBase):
                 if offset == 0:
                     consolidated_rows.append(row)
                 elif offset < 0:
+                    # prepend the padding with one slice assignment per row
+                    # instead of inserting at the front repeatedly
+                    padding = [-1] * abs(offset)
                     for consrow in consolidated_rows:
-                        for o in range(abs(offset)):
-                            consrow.insert(0, -1)
+                        consrow[:0] = padding
                     consolidated_rows.append(row)
                 elif offset > 0:
                     offset_list = [-1] * abs(offset)
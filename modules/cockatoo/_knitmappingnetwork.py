@@ -58,10 +58,8 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
         else:
             name = "KnitMappingNetwork"
 
-        nn = len(self.nodes())
-        ce = len(self.contour_edges)
-        wee = len(self.weft_edges)
-        wae = len(self.warp_edges)
+        nn = self.number_of_nodes()
+        ce, wee, wae = self._count_edge_types()
         data = ("({} Nodes, {} Segment Contours, {} Weft, {} Warp)")
         data = data.format(nn, ce, wee, wae)
 
@@ -88,7 +86,8 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
     def traverse_segments_until_warp(self,
                                      way_segments,
                                      down=False,
-                                     by_end=False):
+                                     by_end=False,
+                                     segment_index=None):
         """
         Method for traversing a path of 'segment' edges until a 'warp'
         edge is discovered which points to the previous or the next segment.
@@ -113,6 +112,14 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
 
             Defaults to ``False``.
 
+        segment_index : :obj:`tuple` of :obj:`dict`, optional
+            Precomputed 2-tuple of (by_start, by_end) lookups of the segment
+            contour edges at their 'end' nodes as built by
+            ``_end_node_segment_index()``. If ``None``, the connected segments
+            will be queried from the network at every step.
+
+            Defaults to ``None``.
+
         Returns
         -------
         segments : :obj:`list`
@@ -169,7 +176,14 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
                     break
 
             # get all connected segments at the last point of the segment
-            if by_end:
+            if segment_index != None:
+                if by_end:
+                    connected_segments = segment_index[1].get(
+                                                  current_segment[0], [])
+                else:
+                    connected_segments = segment_index[0].get(
+                                                  current_segment[1], [])
+            elif by_end:
                 connected_segments = self.end_node_segments_by_end(
                                                   current_segment[0],
                                                   data=True)
@@ -220,6 +234,11 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
         AllWarpEdges = self.warp_edges
         AllWarpEdges.sort(key=lambda e: e[0])
 
+        # look up the segment contour edges at their 'end' nodes once instead
+        # of querying the network for every step of every traversal
+        segment_index = self._end_node_segment_index()
+        segments_by_start = segment_index[0]
+
         # initialize lists and dictionaries for storage of chains
         source_chains = []
         target_chains = []
@@ -239,9 +258,7 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
             # get the connected segments at the start of the 'warp edge'
             warpStart = warp_edge[0]
             warpStartLeafFlag = self.node[warpStart]["leaf"]
-            connected_start_segments = self.end_node_segments_by_start(
-                                                            warpStart,
-                                                            data=True)
+            connected_start_segments = segments_by_start.get(warpStart, [])
 
             # TODO:
             # 1) build plane for reference. plane should be fit through warp
@@ -326,8 +343,9 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
                     # edge until a 'upwards' connection is found and append
                     # it to the source chains of this pass
                     segment_chain = self.traverse_segments_until_warp(
-                                                            [cs[2]["segment"]],
-                                                            down=False)
+                                                [cs[2]["segment"]],
+                                                down=False,
+                                                segment_index=segment_index)
                     index = len([c for c in source_pass_chains
                                  if c[0][0][0] == segment_chain[0][0]
                                  and c[0][-1][1] == segment_chain[-1][1]])
@@ -343,8 +361,9 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
                     # target (!) chains of this pass
                     if warpStartLeafFlag:
                         segment_chain = self.traverse_segments_until_warp(
-                                                            [cs[2]["segment"]],
-                                                            down=True)
+                                                [cs[2]["segment"]],
+                                                down=True,
+                                                segment_index=segment_index)
                         index = len([c for c in target_pass_chains
                                      if c[0][0][0] == segment_chain[0][0]
                                      and c[0][-1][1] == segment_chain[-1][1]])
@@ -359,9 +378,7 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
             # get the connected segments at the end
             warpEnd = warp_edge[1]
             warpEndLeafFlag = self.node[warpEnd]["leaf"]
-            connected_end_segments = self.end_node_segments_by_start(
-                                                                warpEnd,
-                                                                data=True)
+            connected_end_segments = segments_by_start.get(warpEnd, [])
             # traverse segments from end node of 'warp' edge
             if len(connected_end_segments) > 0:
                 for j, cs in enumerate(connected_end_segments):
@@ -370,8 +387,9 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
                     # source (!) chains of this pass
                     if warpEndLeafFlag:
                         segment_chain = self.traverse_segments_until_warp(
-                                                            [cs[2]["segment"]],
-                                                            down=False)
+                                                [cs[2]["segment"]],
+                                                down=False,
+                                                segment_index=segment_index)
                         index = len([c for c in source_pass_chains
                                      if c[0][0][0] == segment_chain[0][0]
                                      and c[0][-1][1] == segment_chain[-1][1]])
@@ -384,8 +402,9 @@ class KnitMappingNetwork(nx.MultiGraph, KnitNetworkBase):
                     # travel the connected segments until a 'downwards'
                     # connection is found and append to target pass chains
                     segment_chain = self.traverse_segments_until_warp(
-                                                            [cs[2]["segment"]],
-                                                            down=True)
+                                                [cs[2]["segment"]],
+                                                down=True,
+                                                segment_index=segment_index)
                     index = len([c for c in target_pass_chains
                                  if c[0][0][0] == segment_chain[0][0]
                                  and c[0][-1][1] == segment_chain[-1][1]])
@@ -13,14 +13,11 @@ __all__ = [
     "KnitNetwork"
 ]
 
-# THIRD PARTY MODULE IMPORTS --------------------------------------------------
-import networkx as nx
-
 # LOCAL MODULE IMPORTS --------------------------------------------------------
 from cockatoo._knitnetworkbase import KnitNetworkBase
 from cockatoo._knitmappingnetwork import KnitMappingNetwork
 from cockatoo._knitdinetwork import KnitDiNetwork
-from cockatoo.environment import RHINOINSIDE
+from cockatoo.environment import RHINOINSIDE  # NOQA: F401
 from cockatoo.exception import KnitNetworkError
 from cockatoo.exception import KnitNetworkGeometryError
 from cockatoo.exception import NoEndNodesError
@@ -29,30 +26,17 @@ from cockatoo.exception import MappingNetworkError
 from cockatoo.utilities import pairwise
 
 # RHINO IMPORTS ---------------------------------------------------------------
-if RHINOINSIDE:
-    import rhinoinside
-    rhinoinside.load()
-    from Rhino.Geometry import Brep as RhinoBrep
-    from Rhino.Geometry import Curve as RhinoCurve
-    from Rhino.Geometry import Line as RhinoLine
-    from Rhino.Geometry import Interval as RhinoInterval
-    from Rhino.Geometry import Mesh as RhinoMesh
-    from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
-    from Rhino.Geometry import Point3d as RhinoPoint3d
-    from Rhino.Geometry import Polyline as RhinoPolyline
-    from Rhino.Geometry import Surface as RhinoSurface
-    from Rhino.Geometry import Vector3d as RhinoVector3d
-else:
-    from Rhino.Geometry import Brep as RhinoBrep
-    from Rhino.Geometry import Curve as RhinoCurve
-    from Rhino.Geometry import Line as RhinoLine
-    from Rhino.Geometry import Interval as RhinoInterval
-    from Rhino.Geometry import Mesh as RhinoMesh
-    from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
-    from Rhino.Geometry import Point3d as RhinoPoint3d
-    from Rhino.Geometry import Polyline as RhinoPolyline
-    from Rhino.Geometry import Surface as RhinoSurface
-    from Rhino.Geometry import Vector3d as RhinoVector3d
+# rhinoinside has already been loaded by cockatoo.environment if needed
+from Rhino.Geometry import Brep as RhinoBrep
+from Rhino.Geometry import Curve as RhinoCurve
+from Rhino.Geometry import Line as RhinoLine
+from Rhino.Geometry import Interval as RhinoInterval
+from Rhino.Geometry import Mesh as RhinoMesh
+from Rhino.Geometry import NurbsSurface as RhinoNurbsSurface
+from Rhino.Geometry import Point3d as RhinoPoint3d
+from Rhino.Geometry import Polyline as RhinoPolyline
+from Rhino.Geometry import Surface as RhinoSurface
+from Rhino.Geometry import Vector3d as RhinoVector3d
 
 # CLASS DECLARATION -----------------------------------------------------------
 
@@ -273,10 +257,8 @@ class KnitNetwork(KnitNetworkBase):
         else:
             name = "KnitNetwork"
 
-        nn = len(self.nodes())
-        ce = len(self.contour_edges)
-        wee = len(self.weft_edges)
-        wae = len(self.warp_edges)
+        nn = self.number_of_nodes()
+        ce, wee, wae = self._count_edge_types()
         data = ("({} Nodes, {} Position Contours, {} Weft, {} Warp)")
         data = data.format(nn, ce, wee, wae)
 
@@ -689,9 +671,8 @@ class KnitNetwork(KnitNetworkBase):
 
         v_print = print if verbose else lambda *a, **k: None
 
-        # get attributes only once
-        position_attributes = nx.get_node_attributes(self, "position")
-        num_attributes = nx.get_node_attributes(self, "num")
+        # bind the node attribute dict once
+        node_data = self.node
 
         if len(contour_set) < 2:
             v_print("Not enough contours in contour set!")
@@ -735,9 +716,9 @@ class KnitNetwork(KnitNetworkBase):
                     weftEdgeFrom = weftEdge[0]
                     weftEdgeTo = weftEdge[1]
                     if weftEdgeFrom != node[0]:
-                        posEdgeTarget = position_attributes[weftEdgeFrom]
+                        posEdgeTarget = node_data[weftEdgeFrom]["position"]
                     elif weftEdgeTo != node[0]:
-                        posEdgeTarget = position_attributes[weftEdgeTo]
+                        posEdgeTarget = node_data[weftEdgeTo]["position"]
                     if posEdgeTarget not in conPos:
                         conPos.append(posEdgeTarget)
 
@@ -814,11 +795,11 @@ class KnitNetwork(KnitNetworkBase):
                         edgeFrom = edge[0]
                         edgeTo = edge[1]
                         if edgeFrom != prevNode[0]:
-                            prevNodeTargetPos = position_attributes[edgeFrom]
-                            prevNodeTargetIndex = num_attributes[edgeFrom]
+                            prevNodeTargetPos = node_data[edgeFrom]["position"]
+                            prevNodeTargetIndex = node_data[edgeFrom]["num"]
                         elif edgeTo != prevNode[0]:
-                            prevNodeTargetPos = position_attributes[edgeTo]
-                            prevNodeTargetIndex = num_attributes[edgeTo]
+                            prevNodeTargetPos = node_data[edgeTo]["position"]
+                            prevNodeTargetIndex = node_data[edgeTo]["num"]
                         if prevNodeTargetPos == target_position:
                             possible_connections.append(
                                            target_nodes[prevNodeTargetIndex])
@@ -1180,41 +1161,45 @@ class KnitNetwork(KnitNetworkBase):
     # ASSIGNING OF 'SEGMENT' ATTRIBUTES FOR MAPPING NETWORK -------------------
 
     def _traverse_weft_edge_until_end(self, start_end_node, start_node,
-                                      seen_segments, way_nodes=None,
-                                      way_edges=None, end_nodes=None):
+                                      start_edge, seen_segments,
+                                      weft_adjacency=None):
         """
         Private method for traversing a path of 'weft' edges until another
         'end' node is discoverd.
         """
 
-        # initialize output lists
-        if way_nodes == None:
-            way_nodes = deque()
-            way_nodes.append(start_node[0])
-        if way_edges == None:
-            way_edges = deque()
-        if end_nodes == None:
-            end_nodes = deque()
-
-        # get the connected edges and filter them, sort out the ones that
-        # already have a 'segment' attribute assigned
-        connected_weft_edges = self.node_weft_edges(start_node[0], data=True)
-        filtered_weft_edges = []
-        for cwe in connected_weft_edges:
-            if cwe[2]["segment"] != None:
-                continue
-            if cwe in way_edges:
-                continue
-            elif (cwe[1], cwe[0], cwe[2]) in way_edges:
-                continue
-            filtered_weft_edges.append(cwe)
-
-        if len(filtered_weft_edges) > 1:
-            print(filtered_weft_edges)
-            print("More than one filtered candidate weft edge! " +
-                  "Segment complete...?")
-        elif len(filtered_weft_edges) == 1:
-            fwec = filtered_weft_edges[0]
+        # initialize the traversed nodes and edges
+        way_nodes = deque([start_node[0]])
+        way_edges = deque([start_edge])
+
+        # keep track of the traversed edges for fast lookup
+        visited_edges = set([frozenset((start_edge[0], start_edge[1]))])
+
+        # walk along the 'weft' edges until an 'end' node is discovered
+        while True:
+            # get the connected edges and filter them, sort out the ones that
+            # already have a 'segment' attribute assigned
+            if weft_adjacency == None:
+                connected_weft_edges = self.node_weft_edges(start_node[0],
+                                                            data=True)
+            else:
+                connected_weft_edges = weft_adjacency[start_node[0]]
+            filtered_weft_edges = (
+                    cwe for cwe in connected_weft_edges
+                    if cwe[2]["segment"] == None
+                    and frozenset((cwe[0], cwe[1])) not in visited_edges)
+
+            # only the first two candidates are needed to decide
+            fwec = next(filtered_weft_edges, None)
+            if fwec == None:
+                return seen_segments
+            second_fwec = next(filtered_weft_edges, None)
+            if second_fwec != None:
+                print([fwec, second_fwec])
+                print("More than one filtered candidate weft edge! " +
+                      "Segment complete...?")
+                return seen_segments
+
             connected_node = (fwec[1], self.node[fwec[1]])
 
             # if the connected node is an end node, the segment is finished
@@ -1226,15 +1211,11 @@ class KnitNetwork(KnitNetworkBase):
                 else:
                     segStart = start_end_node
                     segEnd = connected_node[0]
-                if (segStart, segEnd) in seen_segments:
-                    segIndex = len([s for s in seen_segments
-                                    if s == (segStart, segEnd)])
-                else:
-                    segIndex = 0
+                # get segment index
+                segIndex = seen_segments.get((segStart, segEnd), 0)
                 # append the relevant data to the lists
-                end_nodes.append(connected_node[0])
                 way_edges.append(fwec)
-                seen_segments.append((segStart, segEnd))
+                seen_segments[(segStart, segEnd)] = segIndex + 1
                 # set final 'segment' attributes to all the way nodes
                 for waynode in way_nodes:
                     self.node[waynode]["segment"] = (segStart,
@@ -1247,32 +1228,26 @@ class KnitNetwork(KnitNetworkBase):
                                                                segIndex)
                 # return the seen segments
                 return seen_segments
-            else:
-                # set the initial segment attribute to the node
-                self.node[connected_node[0]]["segment"] = (start_end_node,
-                                                           None,
-                                                           None)
-
-                # set the initial segment attribute to the edge
-                self[fwec[0]][fwec[1]]["segment"] = (start_end_node,
-                                                     None,
-                                                     None)
-                # append the relevant data to the lists
-                way_nodes.append(connected_node[0])
-                way_edges.append(fwec)
 
-                # call this method recursively until a 'end' node is found
-                return self._traverse_weft_edge_until_end(
-                                                    start_end_node,
-                                                    connected_node,
-                                                    seen_segments,
-                                                    way_nodes,
-                                                    way_edges,
-                                                    end_nodes)
-        else:
-            return seen_segments
-
-    def traverse_weft_edges_and_set_attributes(self, start_end_node):
+            # set the initial segment attribute to the node
+            self.node[connected_node[0]]["segment"] = (start_end_node,
+                                                       None,
+                                                       None)
+
+            # set the initial segment attribute to the edge
+            self[fwec[0]][fwec[1]]["segment"] = (start_end_node,
+                                                 None,
+                                                 None)
+            # append the relevant data to the lists
+            way_nodes.append(connected_node[0])
+            way_edges.append(fwec)
+            visited_edges.add(frozenset((fwec[0], fwec[1])))
+
+            # continue the traversal from the connected node
+            start_node = connected_node
+
+    def traverse_weft_edges_and_set_attributes(self, start_end_node,
+                                               weft_adjacency=None):
         """
         Traverse a path of 'weft' edges starting from an 'end' node until
         another 'end' node is discovered. Set 'segment' attributes to nodes
@@ -1280,14 +1255,25 @@ class KnitNetwork(KnitNetworkBase):
 
         start_end_node : :obj:`tuple`
             2-tuple representing the node to start the traversal.
+
+        weft_adjacency : dict, optional
+            Dictionary mapping every node to a list of its connected 'weft'
+            edges as 3-tuples. If supplied, the connected 'weft' edges are
+            looked up in it instead of being filtered from the network.
+
+            Defaults to ``None``.
         """
 
         # get connected weft edges and sort them by their connected node
-        weft_connections = self.node_weft_edges(start_end_node[0], data=True)
+        if weft_adjacency == None:
+            weft_connections = self.node_weft_edges(start_end_node[0],
+                                                    data=True)
+        else:
+            weft_connections = list(weft_adjacency[start_end_node[0]])
         weft_connections.sort(key=lambda x: x[1])
 
         # loop through all connected weft edges
-        seen_segments = []
+        seen_segments = {}
         for cwe in weft_connections:
             # check if connected weft edge already has a segment attribute
             if cwe[2]["segment"]:
@@ -1307,24 +1293,21 @@ class KnitNetwork(KnitNetworkBase):
                     segEnd = connected_node[0]
 
                 # get segment index
-                if (segStart, segEnd) in seen_segments:
-                    segIndex = len([s for s in seen_segments
-                                    if s == (segStart, segEnd)])
-                else:
-                    segIndex = 0
+                segIndex = seen_segments.get((segStart, segEnd), 0)
 
                 # set the final segment attribute to the edge
                 self[cwe[0]][cwe[1]]["segment"] = (segStart, segEnd, segIndex)
-                seen_segments.append((segStart, segEnd))
+                seen_segments[(segStart, segEnd)] = segIndex + 1
 
             # if the connected node is not an end node, we need to travel
             # until we find one
             else:
                 seen_segments = self._traverse_weft_edge_until_end(
-                                                        start_end_node[0],
-                                                        connected_node,
-                                                        seen_segments,
-                                                        way_edges=[cwe])
+                                            start_end_node[0],
+                                            connected_node,
+                                            cwe,
+                                            seen_segments,
+                                            weft_adjacency=weft_adjacency)
 
     def assign_segment_attributes(self):
         """
@@ -1332,25 +1315,33 @@ class KnitNetwork(KnitNetworkBase):
         attributes to 'weft' edges and nodes.
         """
 
-        if len(self.weft_edges) == 0:
+        # only check for existence, stop at the first match
+        if not any(d["weft"] and not d["warp"]
+                   for u, v, d in self.edges_iter(data=True)):
             errMsg = ("No 'weft' edges in KnitNetwork! Segmentation " +
                       "is impossible.")
             raise NoWeftEdgesError(errMsg)
-        if len(self.end_nodes) == 0:
+        if not any(d["end"] for n, d in self.nodes_iter(data=True)):
             errMsg = ("No 'end' nodes in KnitNetwork! Segmentation " +
                       "is impossible.")
             raise NoEndNodesError(errMsg)
 
-        # remove contour and 'warp' edges and store them
+        # store contour and 'warp' edges and remove them all at once
         warp_storage = []
         contour_storage = []
-        for edge in self.edges(data=True):
+        for edge in self.edges_iter(data=True):
             if not edge[2]["weft"]:
                 if edge[2]["warp"]:
                     warp_storage.append(edge)
                 else:
                     contour_storage.append(edge)
-                self.remove_edge(edge[0], edge[1])
+        self.remove_edges_from(warp_storage + contour_storage)
+
+        # collect the connected 'weft' edges of every node once
+        weft_adjacency = {}
+        for node, nbrs in self.adj.items():
+            weft_adjacency[node] = [(node, nbr, d) for nbr, d in nbrs.items()
+                                    if d["weft"]]
 
         # get all 'end' nodes ordered by their 'position' attribute
         all_ends_by_position = self.all_ends_by_position(data=True)
@@ -1358,11 +1349,12 @@ class KnitNetwork(KnitNetworkBase):
         # loop through all 'end' nodes
         for position in all_ends_by_position:
             for endnode in position:
-                self.traverse_weft_edges_and_set_attributes(endnode)
+                self.traverse_weft_edges_and_set_attributes(
+                                            endnode,
+                                            weft_adjacency=weft_adjacency)
 
         # add all previously removed edges back into the network
-        [self.add_edge(edge[0], edge[1], attr_dict=edge[2])
-         for edge in warp_storage + contour_storage]
+        self.add_edges_from(warp_storage + contour_storage)
 
     # CREATION OF MAPPING NETWORK ---------------------------------------------
 
@@ -1397,18 +1389,20 @@ class KnitNetwork(KnitNetworkBase):
         # create a new KnitMappingNetwork instance
         MappingNetwork = KnitMappingNetwork()
 
-        # get all edges of the current network by segment
-        weft_edges = sorted(self.weft_edges, key=lambda x: x[2]["segment"])
-        warp_edges = self.warp_edges
-
-        # initialize deque container for segment ids
-        segment_ids = deque()
+        # get all 'weft' and 'warp' edges of the current network at once
+        _, weft_edges, warp_edges = self._edges_by_type()
 
-        # loop through all 'weft' edges and fill container with unique ids
+        # group all 'weft' edges by segment
+        segment_edges_by_id = {}
         for edge in weft_edges:
             segment_id = edge[2]["segment"]
-            if segment_id not in segment_ids:
-                segment_ids.append(segment_id)
+            if segment_id not in segment_edges_by_id:
+                segment_edges_by_id[segment_id] = [edge]
+            else:
+                segment_edges_by_id[segment_id].append(edge)
+
+        # get all unique segment ids in ascending order
+        segment_ids = sorted(segment_edges_by_id.keys())
 
         # error checking
         if len(segment_ids) == 0:
@@ -1423,8 +1417,8 @@ class KnitNetwork(KnitNetworkBase):
         # loop through all unique segment ids
         for id in segment_ids:
             # get the corresponding edges for this id and sort them
-            segment_edges = [e for e in weft_edges if e[2]["segment"] == id]
-            segment_edges.sort(key=lambda x: x[0])
+            segment_edges = segment_edges_by_id[id]
+            segment_edges.sort(key=itemgetter(0))
             # extract start and end nodes
             start_node = (id[0], self.node[id[0]])
             endNode = (id[1], self.node[id[1]])
@@ -1442,23 +1436,18 @@ class KnitNetwork(KnitNetworkBase):
                 raise KnitNetworkError(errMsg)
 
         # add all warp edges to the mapping network to avoid lookup hassle
-        for warp_edge in warp_edges:
-            if warp_edge[0] > warp_edge[1]:
-                warp_from = warp_edge[1]
-                warp_to = warp_edge[0]
-            else:
-                warp_from = warp_edge[0]
-                warp_to = warp_edge[1]
-            MappingNetwork.add_edge(warp_from, warp_to, attr_dict=warp_edge[2])
+        MappingNetwork.add_edges_from([(u, v, d) if u < v else (v, u, d)
+                                       for u, v, d in warp_edges])
 
         # set mapping network property for this instance
         self.mapping_network = MappingNetwork
 
         # ditch all edges that are not 'warp' and nodes without 'end' attribute
-        [self.remove_node(n) for n, d in self.nodes_iter(data=True)
-         if not d["end"]]
-        [self.remove_edge(s, e) for s, e, d in self.edges_iter(data=True)
-         if not d["warp"]]
+        self.remove_nodes_from([n for n, d in self.nodes_iter(data=True)
+                                if not d["end"]])
+        self.remove_edges_from([(s, e) for s, e, d
+                                in self.edges_iter(data=True)
+                                if not d["warp"]])
 
         return True
 
@@ -1913,9 +1902,9 @@ class KnitNetwork(KnitNetworkBase):
                 # get previous connected edge and its direction
                 prevEdges = self.node_warp_edges(node[0], data=True)
                 if len(prevEdges) > 1:
-                    print("More than one previous " +
-                          "'warp' connection! This was unexpected..." +
-                          "Taking the first one..?")
+                    v_print("More than one previous " +
+                            "'warp' connection! This was unexpected..." +
+                            "Taking the first one..?")
                     prevDir = prevEdges[0][2]["geo"].Direction
                 else:
                     prevDir = prevEdges[0][2]["geo"].Direction
@@ -2119,19 +2108,30 @@ class KnitNetwork(KnitNetworkBase):
         # define verbose print function
         v_print = print if verbose else lambda *a, **k: None
 
-        # get all segment ids, nodes per segment and edges
-        SegmentValues, AllNodesBySegment, SegmentContourEdges = zip(
-                        *self.all_nodes_by_segment(data=True, edges=True))
-
-        # build a dictionary of the segments by their index
-        SegmentDict = dict(zip(SegmentValues,
-                               zip(SegmentContourEdges, AllNodesBySegment)))
+        # build a dictionary of the segments and their contour geometry by
+        # their index in a single pass over all segments
+        segments = self.all_nodes_by_segment(data=True, edges=True)
+        SegmentDict = {}
+        SegmentGeo = {}
+        for segval, segnodes, segedge in segments:
+            SegmentDict[segval] = (segedge, segnodes)
+            SegmentGeo[segval] = segedge[2]["geo"]
 
         # build source and target chains
         source_chains, target_chain_dict = self.mapping_network.build_chains(
                                                                     False,
                                                                     True)
 
+        # group the target chain keys by their leading chain values, so that
+        # every guess only has to look at matching keys
+        target_keys_by_value = {}
+        for key in target_chain_dict:
+            value = (key[0], key[1])
+            if value not in target_keys_by_value:
+                target_keys_by_value[value] = [key]
+            else:
+                target_keys_by_value[value].append(key)
+
         # initialize container dict for connected chains
         connected_chains = dict()
 
@@ -2152,13 +2152,15 @@ class KnitNetwork(KnitNetworkBase):
                          self.node[source_chain[0][0][0]])
             lastNode = (source_chain[0][-1][1],
                         self.node[source_chain[0][-1][1]])
+            # get the adjacencies of the first and last node
+            firstAdj = self[firstNode[0]]
+            lastAdj = self[lastNode[0]]
             # get the chain value of the current chain
             chain_value = source_chain[1]
             # extract the ids of the current chain
             current_ids = tuple(source_chain[0])
             # extract the current chains geometry
-            current_chain_geo_list = [SegmentDict[id][0][2]["geo"]
-                                      for id in current_ids]
+            current_chain_geo_list = [SegmentGeo[id] for id in current_ids]
             current_chain_geo = RhinoCurve.JoinCurves(
                 [ccg.ToPolylineCurve() for ccg in current_chain_geo_list])[0]
             current_chain_spt = current_chain_geo.PointAtNormalizedLength(0.5)
@@ -2182,10 +2184,10 @@ class KnitNetwork(KnitNetworkBase):
             # CASE 1 - ENCLOSED SHORT ROW <====> ALL CASES --------------------
 
             # look for possible targets using a guess about the chain value
-            possible_target_keys = [key for key in target_chain_dict
-                                    if key[0] == chain_value[0]
-                                    and key[1] == chain_value[1]
-                                    and key not in connected_chains]
+            possible_target_keys = [key for key in target_keys_by_value.get(
+                                        (chain_value[0], chain_value[1]),
+                                        [])
+                                    if key not in connected_chains]
             if len(possible_target_keys) > 0:
                 # find the correct chain by using geometric distance
                 possible_target_chains = [target_chain_dict[tk] for tk
@@ -2196,7 +2198,7 @@ class KnitNetwork(KnitNetworkBase):
                 possible_target_chain_dists = []
                 for j, ptc in enumerate(possible_target_chains):
                     # retrieve possible target geometry and join into one crv
-                    ptc_geo_list = [SegmentDict[id][0][2]["geo"] for id in ptc]
+                    ptc_geo_list = [SegmentGeo[id] for id in ptc]
                     if ptc_geo_list == current_chain_geo_list:
                         continue
                     ptc_geo = RhinoCurve.JoinCurves(
@@ -2272,10 +2274,10 @@ class KnitNetwork(KnitNetworkBase):
             # CASE 2 - SHORT ROW TO THE RIGHT <=====/ ALL CASES ---------------
 
             # look for possible targets using a guess about the chain value
-            possible_target_keys = [key for key in target_chain_dict
-                                    if key[0] == chain_value[0]
-                                    and key[1] == chain_value[1]+1
-                                    and key not in connected_chains]
+            possible_target_keys = [key for key in target_keys_by_value.get(
+                                        (chain_value[0], chain_value[1]+1),
+                                        [])
+                                    if key not in connected_chains]
             if len(possible_target_keys) == 1:
                 target_key = possible_target_keys[0]
             elif len(possible_target_keys) > 1:
@@ -2287,7 +2289,7 @@ class KnitNetwork(KnitNetworkBase):
                 possible_target_chain_dists = []
                 for ptc in possible_target_chains:
                     # retrieve possible target geometry and join into one crv
-                    ptc_geo = [SegmentDict[id][0][2]["geo"] for id in ptc]
+                    ptc_geo = [SegmentGeo[id] for id in ptc]
                     ptc_geo = RhinoCurve.JoinCurves([pg.ToPolylineCurve()
                                                      for pg in ptc_geo])[0]
                     # get a sample point and measure the distance to the
@@ -2330,7 +2332,7 @@ class KnitNetwork(KnitNetworkBase):
                 # check if firstNode and targetFirstNode are connected via a
                 # 'warp' edge to verify
                 if (targetFirstNode == firstNode[0]
-                        and targetLastNode in self[lastNode[0]]):
+                        and targetLastNode in lastAdj):
                     # print info on verbose setting
                     v_print("<=====/ detected. Connecting " +
                             "to segment {}.".format(target_key))
@@ -2362,10 +2364,10 @@ class KnitNetwork(KnitNetworkBase):
             # CASE 3 - SHORT ROW TO THE LEFT /====> ALL CASES -----------------
 
             # look for possible targets using a guess about the chain value
-            possible_target_keys = [key for key in target_chain_dict
-                                    if key[0] == chain_value[0]+1
-                                    and key[1] == chain_value[1]
-                                    and key not in connected_chains]
+            possible_target_keys = [key for key in target_keys_by_value.get(
+                                        (chain_value[0]+1, chain_value[1]),
+                                        [])
+                                    if key not in connected_chains]
             if len(possible_target_keys) == 1:
                 target_key = possible_target_keys[0]
             elif len(possible_target_keys) > 1:
@@ -2377,7 +2379,7 @@ class KnitNetwork(KnitNetworkBase):
                 possible_target_chain_dists = []
                 for ptc in possible_target_chains:
                     # retrieve possible target geometry and join into one crv
-                    ptc_geo = [SegmentDict[id][0][2]["geo"] for id in ptc]
+                    ptc_geo = [SegmentGeo[id] for id in ptc]
                     ptc_geo = RhinoCurve.JoinCurves(
                         [pg.ToPolylineCurve() for pg in ptc_geo])[0]
                     # get a sample point and measure the distance to the
@@ -2419,7 +2421,7 @@ class KnitNetwork(KnitNetworkBase):
 
                 # check if firstNode and targetFirstNode are connected via a
                 # 'warp' edge to verify
-                if (targetFirstNode in self[firstNode[0]]
+                if (targetFirstNode in firstAdj
                         and targetLastNode == lastNode[0]):
                     # print info on verbose setting
                     v_print("/=====> detected. Connecting " +
@@ -2451,10 +2453,10 @@ class KnitNetwork(KnitNetworkBase):
             # CASE 4 - REGULAR ROW /=====/ ALL CASES --------------------------
 
             # look for possible targets using a guess about the chain value
-            possible_target_keys = [key for key in target_chain_dict
-                                    if key[0] == chain_value[0]+1
-                                    and key[1] == chain_value[1]+1
-                                    and key not in connected_chains]
+            possible_target_keys = [key for key in target_keys_by_value.get(
+                                        (chain_value[0]+1, chain_value[1]+1),
+                                        [])
+                                    if key not in connected_chains]
             if len(possible_target_keys) == 1:
                 target_key = possible_target_keys[0]
             elif len(possible_target_keys) > 1:
@@ -2466,7 +2468,7 @@ class KnitNetwork(KnitNetworkBase):
                 possible_target_chain_dists = []
                 for ptc in possible_target_chains:
                     # retrieve possible target geometry and join into one crv
-                    ptc_geo = [SegmentDict[id][0][2]["geo"] for id in ptc]
+                    ptc_geo = [SegmentGeo[id] for id in ptc]
                     ptc_geo = RhinoCurve.JoinCurves([pg.ToPolylineCurve()
                                                      for pg in ptc_geo])[0]
                     # get a sample point and measure the distance to the
@@ -2509,8 +2511,8 @@ class KnitNetwork(KnitNetworkBase):
 
                 # check if firstNode and targetFirstNode are connected via a
                 # 'warp' edge to verify
-                if (targetFirstNode in self[firstNode[0]]
-                        and targetLastNode in self[lastNode[0]]):
+                if (targetFirstNode in firstAdj
+                        and targetLastNode in lastAdj):
                     # print info on verbose setting
                     v_print("/=====/ detected. Connecting " +
                             "to segment {}.".format(target_key))
@@ -2828,6 +2830,7 @@ class KnitNetwork(KnitNetworkBase):
                               for v, data in nbrs.items())
         dirnet.graph = self.graph
         dirnet.node = self.node
+        dirnet._invalidate_node_index()
         dirnet.mapping_network = self.mapping_network
 
         return dirnet
@@ -3022,7 +3025,7 @@ class KnitNetwork(KnitNetworkBase):
             centroid_pt = RhinoPoint3d(*centroid)
 
             # get node 'leaf' attributes
-            is_leaf = True in [node_data[k]["leaf"] for k in cycle]
+            is_leaf = any(node_data[k]["leaf"] for k in cycle)
 
             # get node 'color' attributes. only if all colors of the cycle
             # match, the color attribute will be set!
@@ -3237,6 +3240,13 @@ class KnitNetwork(KnitNetworkBase):
             trailing_left = deque([t for t in trailing if t[1]["start"]])
             trailing_right = deque([t for t in trailing if not t[1]["start"]])
 
+            # bind node and adjacency dicts as well as the edge constructor
+            # locally for repeated lookups
+            dual_node = DualNetwork.node
+            dual_pred = DualNetwork.pred
+            dual_succ = DualNetwork.succ
+            create_warp_edge = DualNetwork.create_warp_edge
+
             # from the trailing left nodes...
             # travel one outgoing 'weft'
             # from there travel one incoming 'warp'
@@ -3267,9 +3277,9 @@ class KnitNetwork(KnitNetworkBase):
                 if not warp_in:
                     continue
                 warp_in = warp_in[0]
-                candidate = (warp_in[0], DualNetwork.node[warp_in[0]])
-                nce = len(DualNetwork.in_edges(warp_in[0]))
-                nce += len(DualNetwork.edges(warp_in[0]))
+                candidate = (warp_in[0], dual_node[warp_in[0]])
+                nce = (len(dual_pred[warp_in[0]]) +
+                       len(dual_succ[warp_in[0]]))
                 # if this condition holds, we have a trailing increase
                 if (candidate[1]["start"]
                         and candidate[1]["end"]
@@ -3277,18 +3287,17 @@ class KnitNetwork(KnitNetworkBase):
                     # remove found 'warp' edge
                     DualNetwork.remove_edge(warp_in[0], warp_in[1])
                     # assign 'increase' attribute to former 'warp' edge target
-                    DualNetwork.node[warp_in[1]]["increase"] = True
+                    dual_node[warp_in[1]]["increase"] = True
                     # connect candidate to trail with new 'warp' edge
-                    DualNetwork.create_warp_edge(candidate, trail)
+                    create_warp_edge(candidate, trail)
                     # remove 'leaf' attribute of former trail
                     trail[1]["leaf"] = False
                 else:
                     if warp_out:
                         warp_out = warp_out[0]
-                        candidate = (warp_out[1],
-                                     DualNetwork.node[warp_out[1]])
-                        nce = len(DualNetwork.in_edges(warp_out[1]))
-                        nce += len(DualNetwork.edges(warp_out[1]))
+                        candidate = (warp_out[1], dual_node[warp_out[1]])
+                        nce = (len(dual_pred[warp_out[1]]) +
+                               len(dual_succ[warp_out[1]]))
                         # if this condition holds, we have a trailing decrease
                         if (candidate[1]["start"]
                                 and candidate[1]["end"]
@@ -3297,10 +3306,10 @@ class KnitNetwork(KnitNetworkBase):
                             DualNetwork.remove_edge(warp_out[0], warp_out[1])
                             # assign 'decrease' attribute to former 'warp'
                             # edge source
-                            DualNetwork.node[warp_out[0]]["decrease"] = True
+                            dual_node[warp_out[0]]["decrease"] = True
                             # connect former trail to candidate with new
                             # 'warp' edge
-                            DualNetwork.create_warp_edge(trail, candidate)
+                            create_warp_edge(trail, candidate)
                             # remove 'leaf' attribute of former trail
                             trail[1]["leaf"] = False
 
@@ -3320,26 +3329,25 @@ class KnitNetwork(KnitNetworkBase):
                 if not warp_in:
                     continue
                 warp_in = warp_in[0]
-                candidate = (warp_in[0], DualNetwork.node[warp_in[0]])
-                nce = len(DualNetwork.in_edges(warp_in[0]))
-                nce += len(DualNetwork.edges(warp_in[0]))
+                candidate = (warp_in[0], dual_node[warp_in[0]])
+                nce = (len(dual_pred[warp_in[0]]) +
+                       len(dual_succ[warp_in[0]]))
                 # if this condition holds, we have a trailing increase
                 if candidate[1]["end"] and nce == 3:
                     # remove found 'warp' edge
                     DualNetwork.remove_edge(warp_in[0], warp_in[1])
                     # assign 'increase' attribute to former 'warp' edge target
-                    DualNetwork.node[warp_in[1]]["increase"] = True
+                    dual_node[warp_in[1]]["increase"] = True
                     # connect candidate to trail with new 'warp' edge
-                    DualNetwork.create_warp_edge(candidate, trail)
+                    create_warp_edge(candidate, trail)
                     # remove 'leaf' attribute of former trail
                     trail[1]["leaf"] = False
                 else:
                     if warp_out:
                         warp_out = warp_out[0]
-                        candidate = (warp_out[1],
-                                     DualNetwork.node[warp_out[1]])
-                        nce = len(DualNetwork.in_edges(warp_out[1]))
-                        nce += len(DualNetwork.edges(warp_out[1]))
+                        candidate = (warp_out[1], dual_node[warp_out[1]])
+                        nce = (len(dual_pred[warp_out[1]]) +
+                               len(dual_succ[warp_out[1]]))
                         # if this condition holds, we have a trailing decrease
                         if (candidate[1]["start"]
                                 and candidate[1]["end"]
@@ -3348,10 +3356,10 @@ class KnitNetwork(KnitNetworkBase):
                             DualNetwork.remove_edge(warp_out[0], warp_out[1])
                             # assign 'decrease' attribute to former 'warp'
                             # edge source
-                            DualNetwork.node[warp_out[0]]["decrease"] = True
+                            dual_node[warp_out[0]]["decrease"] = True
                             # connect former trail to candidate with new
                             # 'warp' edge
-                            DualNetwork.create_warp_edge(trail, candidate)
+                            create_warp_edge(trail, candidate)
                             # remove 'leaf' attribute of former trail
                             trail[1]["leaf"] = False
 
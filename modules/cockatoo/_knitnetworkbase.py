@@ -2,7 +2,8 @@
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
-from collections import OrderedDict
+from math import sqrt
+from operator import itemgetter
 
 # DUNDER ----------------------------------------------------------------------
 __all__ = [
@@ -13,21 +14,15 @@ __all__ = [
 import networkx as nx
 
 # LOCAL MODULE IMPORTS --------------------------------------------------------
-from cockatoo.environment import RHINOINSIDE
+from cockatoo.environment import RHINOINSIDE  # NOQA: F401
 
 # RHINO IMPORTS ---------------------------------------------------------------
-if RHINOINSIDE:
-    import rhinoinside
-    rhinoinside.load()
-    from Rhino.Geometry import Curve as RhinoCurve
-    from Rhino.Geometry import Line as RhinoLine
-    from Rhino.Geometry import LineCurve as RhinoLineCurve
-    from Rhino.Geometry import Polyline as RhinoPolyline
-else:
-    from Rhino.Geometry import Curve as RhinoCurve
-    from Rhino.Geometry import Line as RhinoLine
-    from Rhino.Geometry import LineCurve as RhinoLineCurve
-    from Rhino.Geometry import Polyline as RhinoPolyline
+# rhinoinside has already been loaded by cockatoo.environment if needed
+from Rhino.Geometry import Curve as RhinoCurve
+from Rhino.Geometry import Line as RhinoLine
+from Rhino.Geometry import LineCurve as RhinoLineCurve
+from Rhino.Geometry import Polyline as RhinoPolyline
+from System import Array
 
 # CLASS DECLARATION -----------------------------------------------------------
 
@@ -87,10 +82,8 @@ class KnitNetworkBase(nx.Graph):
         else:
             name = "KnitNetworkBase"
 
-        nn = len(self.nodes())
-        ce = len(self.contour_edges)
-        wee = len(self.weft_edges)
-        wae = len(self.warp_edges)
+        nn = self.number_of_nodes()
+        ce, wee, wae = self._count_edge_types()
         data = ("({} Nodes, {} Contours, {} Weft, {} Warp)")
         data = data.format(nn, ce, wee, wae)
 
@@ -154,89 +147,82 @@ class KnitNetworkBase(nx.Graph):
         else:
             DotGraph = nx.DiGraph()
 
-        # get all nodes and all edges
-        network_nodes = self.nodes(data=True)
-        network_edges = self.edges(data=True)
-
-        # process all nodes and add them to the dot graph
-        for node in network_nodes:
-            ndata = node[1]
+        # get iterators over all nodes and all edges
+        network_nodes = self.nodes_iter(data=True)
+        network_edges = self.edges_iter(data=True)
 
+        def classify_node(end, leaf, start, increase, decrease):
+            """
+            Returns node type, node color and node text color for a
+            combination of node flags.
+            """
             # END BUT NOT LEAF
-            if ndata["end"] and not ndata["leaf"]:
-                if not ndata["increase"] and not ndata["decrease"]:
-                    if ndata["start"]:
-                        node_type = "S"
-                        node_color = col_start_end
-                        node_txt_color = black
-                    else:
-                        node_type = "E"
-                        node_color = col_end
-                        node_txt_color = white
-
-                elif ndata["increase"] and not ndata["decrease"]:
-                    node_type = "Ei"
-                    node_color = col_increase_end
-                    node_txt_color = black
-                elif not ndata["increase"] and ndata["decrease"]:
-                    node_type = "Ed"
-                    node_color = col_decrease_end
-                    node_txt_color = black
-
-                node_shape = circle
+            if end and not leaf:
+                if increase and not decrease:
+                    return ("Ei", col_increase_end, black)
+                elif decrease and not increase:
+                    return ("Ed", col_decrease_end, black)
+                elif start:
+                    return ("S", col_start_end, black)
+                else:
+                    return ("E", col_end, white)
 
             # LEAF BUT NOT END
-            elif ndata["leaf"] and not ndata["end"]:
-                if ndata["start"]:
-                    node_type = "SL"
-                    node_color = col_start_leaf
+            elif leaf and not end:
+                if start:
+                    return ("SL", col_start_leaf, black)
                 else:
-                    node_type = "L"
-                    node_color = col_leaf
-
-                node_txt_color = black
-                node_shape = circle
+                    return ("L", col_leaf, black)
 
             # END AND LEAF
-            elif ndata["leaf"] and ndata["end"]:
-                if ndata["start"]:
-                    node_type = "SEL"
-                    node_color = col_start_leaf_end
+            elif leaf and end:
+                if start:
+                    return ("SEL", col_start_leaf_end, black)
                 else:
-                    node_type = "EL"
-                    node_color = col_end_leaf
-
-                node_txt_color = black
-                node_shape = circle
+                    return ("EL", col_end_leaf, black)
 
             # NO END NO LEAF
-            elif not ndata["leaf"] and not ndata["end"]:
+            else:
                 # INCREASE
-                if ndata["increase"] and not ndata["decrease"]:
-                    node_type = "i"
-                    node_color = col_increase
+                if increase and not decrease:
+                    return ("i", col_increase, white)
                 # DECREASE
-                elif not ndata["increase"] and ndata["decrease"]:
-                    node_type = "d"
-                    node_color = col_decrease
+                elif decrease and not increase:
+                    return ("d", col_decrease, white)
                 else:
-                    node_type = "R"
-                    node_color = col_regular
+                    return ("R", col_regular, white)
 
-                node_txt_color = white
-                node_shape = circle
+        # lookup table of node styles for all 32 combinations of the node
+        # flags, indexed by the flags packed into bits as
+        # end | leaf | start | increase | decrease
+        node_styles = [classify_node(*[bool(f >> bit & 1)
+                                       for bit in (4, 3, 2, 1, 0)])
+                       for f in range(32)]
 
-            if node[1]["segment"]:
-                node_label = str(node[0]) + "\n" + node_type + "\n" + \
-                             str(node[1]["segment"])
+        # process all nodes and add them to the dot graph
+        for nid, ndata in network_nodes:
+            flags = (bool(ndata["end"]) << 4 |
+                     bool(ndata["leaf"]) << 3 |
+                     bool(ndata["start"]) << 2 |
+                     bool(ndata["increase"]) << 1 |
+                     bool(ndata["decrease"]))
+            node_type, node_color, node_txt_color = node_styles[flags]
+
+            node_shape = circle
+
+            node_segment = ndata["segment"]
+            if node_segment:
+                node_label = str(nid) + "\n" + node_type + "\n" + \
+                             str(node_segment)
             else:
-                node_label = str(node[0]) + node_type
+                node_label = str(nid) + node_type
 
             # make pos attribute for orthogonal layouting
-            if ndata["z"] > 0.0:
+            node_z = ndata["z"]
+            if node_z > 0.0:
                 node_pos = (str(ndata["x"]) + ", " +
                             str(ndata["y"]) + ", " +
-                            str(ndata["z"]))
+                            str(node_z))
             else:
                 node_pos = (str(ndata["x"]) + ", " +
                             str(ndata["y"]))
@@ -251,23 +237,25 @@ class KnitNetworkBase(nx.Graph):
                                "fontsize": nodeFontSize,
                                "margin": 0.0001}
 
-            DotGraph.add_node(node[0], attr_dict=node_attributes)
+            DotGraph.add_node(nid, attr_dict=node_attributes)
 
         # make edge types and labels and add them to the graph
-        for edge in network_edges:
-            padding = "  "
-            if edge[2]["weft"]:
+        padding = "  "
+        for u, v, edata in network_edges:
+            weft = edata["weft"]
+            warp = edata["warp"]
+            if not weft and not warp:
+                edge_type = "C"
+                edge_color = black
+            elif weft:
                 edge_type = "WP"
                 edge_color = blue
-            elif edge[2]["warp"]:
+            else:
                 edge_type = "WT"
                 edge_color = red
-            elif not edge[2]["weft"] and not edge[2]["warp"]:
-                edge_type = "C"
-                edge_color = black
 
-            edge_info = str(edge[0]) + ">" + str(edge[1])
-            edge_segment = edge[2]["segment"]
+            edge_info = str(u) + ">" + str(v)
+            edge_segment = edata["segment"]
             if edge_segment:
                 edge_label = (padding + edge_info + edge_type + "\n" +
                               str(edge_segment))
@@ -275,8 +263,8 @@ class KnitNetworkBase(nx.Graph):
                 edge_label = padding + edge_info + edge_type
 
             DotGraph.add_edge(
-                            edge[0],
-                            edge[1],
+                            u,
+                            v,
                             label=edge_label,
                             fontname=font,
                             fontcolor=black,
@@ -309,22 +297,24 @@ class KnitNetworkBase(nx.Graph):
         else:
             GephiGraph = nx.DiGraph()
 
-        network_nodes = self.nodes(data=True)
-        network_edges = self.edges(data=True)
+        network_nodes = self.nodes_iter(data=True)
+        network_edges = self.edges_iter(data=True)
 
         # add all nodes to the render graph
-        for node in network_nodes:
-            if node[1]["end"] and not node[1]["leaf"]:
+        for nid, ndata in network_nodes:
+            end = ndata["end"]
+            leaf = ndata["leaf"]
+            if end and not leaf:
                 node_type = "end"
                 node_color = red
                 node_shape = circle
 
-            elif node[1]["leaf"] and not node[1]["end"]:
+            elif leaf and not end:
                 node_type = "leaf"
                 node_color = green
                 node_shape = circle
 
-            elif node[1]["leaf"] and node[1]["end"]:
+            elif leaf and end:
                 node_type = "end leaf"
                 node_color = orange
                 node_shape = circle
@@ -338,23 +328,25 @@ class KnitNetworkBase(nx.Graph):
                          "shape": node_shape,
                          "type": node_type}
 
-            GephiGraph.add_node(node[0], attr_dict=nodeAttrs)
+            GephiGraph.add_node(nid, attr_dict=nodeAttrs)
 
         # ad all edges to the render graph
-        for edge in network_edges:
-            if edge[2]["weft"]:
+        for u, v, edata in network_edges:
+            weft = edata["weft"]
+            warp = edata["warp"]
+            if not weft and not warp:
+                continue
+            elif weft:
                 edge_type = "weft"
                 edge_color = blue
-            elif edge[2]["warp"]:
+            else:
                 edge_type = "warp"
                 edge_color = red
-            elif not edge[2]["weft"] and not edge[2]["warp"]:
-                continue
 
             edgeAttrs = {"color": edge_color,
                          "type": edge_type}
 
-            GephiGraph.add_edge(edge[0], edge[1], attr_dict=edgeAttrs)
+            GephiGraph.add_edge(u, v, attr_dict=edgeAttrs)
 
         return GephiGraph
 
@@ -469,10 +461,10 @@ class KnitNetworkBase(nx.Graph):
             The data of the 'geo' attribute of the specified node or ``None``
             if the node is not present or has no 'geo' attribute.
         """
-        try:
-            return self.node[node_index]["geo"]
-        except KeyError:
+        node_data = self.node.get(node_index)
+        if node_data == None:
             return None
+        return node_data.get("geo")
 
     def node_coordinates(self, node_index):
         """
@@ -489,15 +481,142 @@ class KnitNetworkBase(nx.Graph):
         xyz : :obj:`tuple` of :obj:`int`
             The XYZ coordinates of the node as a 3-tuple.
         """
+        node_data = self.node.get(node_index)
+        if node_data == None:
+            return None
         try:
-            node_data = self.node[node_index]
-            NodeX = node_data["x"]
-            NodeY = node_data["y"]
-            NodeZ = node_data["z"]
-            return (NodeX, NodeY, NodeZ)
+            return (node_data["x"], node_data["y"], node_data["z"])
         except KeyError:
             return None
 
+    # NODE INDEX --------------------------------------------------------------
+
+    def _invalidate_node_index(self):
+        """
+        Discards the node index of the network so that it will be rebuilt on
+        the next lookup.
+        """
+
+        self._node_index = None
+
+    def add_node(self, n, attr_dict=None, **attr):
+        """
+        Adds a single node to the network and invalidates the node index.
+        See :meth:`networkx.Graph.add_node` for details.
+        """
+
+        super(KnitNetworkBase, self).add_node(n, attr_dict=attr_dict, **attr)
+        self._invalidate_node_index()
+
+    def add_nodes_from(self, nodes, **attr):
+        """
+        Adds multiple nodes to the network and invalidates the node index.
+        See :meth:`networkx.Graph.add_nodes_from` for details.
+        """
+
+        super(KnitNetworkBase, self).add_nodes_from(nodes, **attr)
+        self._invalidate_node_index()
+
+    def remove_node(self, n):
+        """
+        Removes a single node from the network and invalidates the node index.
+        See :meth:`networkx.Graph.remove_node` for details.
+        """
+
+        super(KnitNetworkBase, self).remove_node(n)
+        self._invalidate_node_index()
+
+    def remove_nodes_from(self, nodes):
+        """
+        Removes multiple nodes from the network and invalidates the node
+        index. See :meth:`networkx.Graph.remove_nodes_from` for details.
+        """
+
+        super(KnitNetworkBase, self).remove_nodes_from(nodes)
+        self._invalidate_node_index()
+
+    def clear(self):
+        """
+        Removes all nodes and edges from the network and invalidates the node
+        index. See :meth:`networkx.Graph.clear` for details.
+        """
+
+        super(KnitNetworkBase, self).clear()
+        self._invalidate_node_index()
+
+    def _build_node_index(self):
+        """
+        Builds the node index of the network by scanning all nodes once and
+        stores it on the instance.
+
+        Returns
+        -------
+        index : :obj:`dict`
+            The node index of the network.
+        """
+
+        # read 'position' and 'num' of every node into flat columns in a
+        # single pass over all nodes
+        max_position = -1
+        columns = {}
+        for n, d in self.nodes_iter(data=True):
+            position = d["position"]
+            if position != None and position > max_position:
+                max_position = position
+            if position not in columns:
+                columns[position] = [(d["num"], n)]
+            else:
+                columns[position].append((d["num"], n))
+
+        # order the nodes on every position by their 'num' column
+        positions = {}
+        for position, column in columns.items():
+            column.sort(key=itemgetter(0))
+            positions[position] = [n for num, n in column]
+
+        index = {"node": self.node,
+                 "size": len(self.node),
+                 "positions": positions,
+                 "max_position": max_position}
+
+        self._node_index = index
+        return index
+
+    def _get_node_index(self):
+        """
+        Gets the node index of the network, rebuilding it if it has been
+        invalidated since it was last built.
+
+        Returns
+        -------
+        index : :obj:`dict`
+            Dictionary with the keys ``'node'`` (the indexed node dictionary),
+            ``'size'`` (the number of indexed nodes), ``'positions'``
+            (mapping of every 'position' attribute value to the identifiers
+            of the nodes on that position, ordered by their 'num' attribute)
+            and ``'max_position'`` (the highest 'position' attribute value or
+            ``-1`` if no node has a 'position' attribute).
+
+        Notes
+        -----
+        The index is invalidated explicitly by the node adding and removing
+        methods of the network. Checking its validity only compares the
+        identity of the node dictionary and the number of nodes, both in
+        constant time. The latter catches nodes which NetworkX adds
+        implicitly when adding an edge.
+
+        Only the 'position' and 'num' attributes are indexed, as they are set
+        on node creation and never altered afterwards. Flags like 'leaf' or
+        'end' are modified in place while the network is being built and are
+        therefore always read from the node data directly.
+        """
+
+        index = getattr(self, "_node_index", None)
+        if (index == None or index["node"] is not self.node
+                or index["size"] != len(self.node)):
+            index = self._build_node_index()
+        return index
+
     # PROPERTIES --------------------------------------------------------------
 
     def _get_total_positions(self):
@@ -505,8 +624,7 @@ class KnitNetworkBase(nx.Graph):
         Gets the number of total positions (i.e. contours) inside the network.
         """
 
-        total = max([n[1]["position"] for n in self.nodes_iter(data=True)])+1
-        return total
+        return self._get_node_index()["max_position"] + 1
 
     total_positions = property(
                             _get_total_positions,
@@ -539,15 +657,11 @@ class KnitNetworkBase(nx.Graph):
             The nodes sharing the supplied 'position' attribute.
         """
 
-        nodes = [(n, d) for n, d in self.nodes_iter(data=True)
-                 if d["position"] == position]
-
-        nodes.sort(key=lambda x: x[1]["num"])
+        position_nodes = self._get_node_index()["positions"].get(position, [])
 
-        if not data:
-            nodes = [n[0] for n in nodes]
-
-        return nodes
+        if data:
+            return [(n, self.node[n]) for n in position_nodes]
+        return position_nodes[:]
 
     def all_nodes_by_position(self, data=False):
         """
@@ -568,25 +682,20 @@ class KnitNetworkBase(nx.Graph):
             All nodes grouped by their 'position' attribute
         """
 
-        allPositionNodes = sorted(
-                                [(n, d) for n, d in self.nodes_iter(data=True)
-                                 if d["position"] != None],
-                                key=lambda x: x[1]["position"])
+        index = self._get_node_index()
+        positions = index["positions"]
 
-        posdict = OrderedDict()
-        for n in allPositionNodes:
-            if n[1]["position"] not in posdict:
-                posdict[n[1]["position"]] = [n]
-            else:
-                posdict[n[1]["position"]].append(n)
+        node = self.node
 
         anbp = []
-        for key in posdict:
-            posnodes = sorted(posdict[key], key=lambda x: x[1]["num"])
+        for position in range(index["max_position"] + 1):
+            posnodes = positions.get(position)
+            if not posnodes:
+                continue
             if data:
-                anbp.append(posnodes)
+                anbp.append([(n, node[n]) for n in posnodes])
             else:
-                anbp.append([pn[0] for pn in posnodes])
+                anbp.append(posnodes[:])
 
         return anbp
 
@@ -616,15 +725,16 @@ class KnitNetworkBase(nx.Graph):
             attribute, ordered by their 'num' attribute.
         """
 
-        nodes = [(n, d) for n, d in self.nodes_iter(data=True)
-                 if d["segment"] == segment]
+        # filter by 'segment' and decorate with 'num' in a single pass
+        column = [(d["num"], n) for n, d in self.nodes_iter(data=True)
+                  if d["segment"] == segment]
 
-        nodes.sort(key=lambda x: x[1]["num"])
+        column.sort(key=itemgetter(0))
 
         if data:
-            return nodes
+            return [(n, self.node[n]) for num, n in column]
         else:
-            return [n[0] for n in nodes]
+            return [n for num, n in column]
 
     # LEAF NODES --------------------------------------------------------------
 
@@ -669,11 +779,11 @@ class KnitNetworkBase(nx.Graph):
             which share the supplied value as their 'position' attribute
         """
 
-        leaves = [(n, d) for n, d
-                  in self.nodes_on_position(position, data=True)
-                  if d["leaf"]]
-        if not data:
-            leaves = [n[0] for n in leaves]
+        node = self.node
+        leaves = [n for n in self.nodes_on_position(position)
+                  if node[n]["leaf"]]
+        if data:
+            return [(n, node[n]) for n in leaves]
         return leaves
 
     def all_leaves_by_position(self, data=False):
@@ -695,25 +805,21 @@ class KnitNetworkBase(nx.Graph):
             'position' attribute
         """
 
-        allPositionLeaves = sorted(
-                            [(n, d) for n, d in self.nodes_iter(data=True)
-                             if d["position"] != None and d["leaf"]],
-                            key=lambda x: x[1]["position"])
+        index = self._get_node_index()
+        positions = index["positions"]
 
-        posdict = OrderedDict()
-        for n in allPositionLeaves:
-            if n[1]["position"] not in posdict:
-                posdict[n[1]["position"]] = [n]
-            else:
-                posdict[n[1]["position"]].append(n)
+        node = self.node
 
         albp = []
-        for key in posdict:
-            posleaves = sorted(posdict[key], key=lambda x: x[1]["num"])
+        for position in range(index["max_position"] + 1):
+            posleaves = [n for n in positions.get(position, [])
+                         if node[n]["leaf"]]
+            if not posleaves:
+                continue
             if data:
-                albp.append(posleaves)
+                albp.append([(n, node[n]) for n in posleaves])
             else:
-                albp.append([pl[0] for pl in posleaves])
+                albp.append(posleaves)
 
         return albp
 
@@ -755,10 +861,11 @@ class KnitNetworkBase(nx.Graph):
             which share the supplied value as their 'position' attribute
         """
 
-        ends = [(n, d) for n, d in self.nodes_on_position(position, data=True)
-                if d["end"]]
-        if not data:
-            return [n[0] for n in ends]
+        node = self.node
+        ends = [n for n in self.nodes_on_position(position)
+                if node[n]["end"]]
+        if data:
+            return [(n, node[n]) for n in ends]
         return ends
 
     def all_ends_by_position(self, data=False):
@@ -780,25 +887,21 @@ class KnitNetworkBase(nx.Graph):
             'position' attribute
         """
 
-        allPositionEnds = sorted(
-                            [(n, d) for n, d in self.nodes_iter(data=True)
-                             if d["position"] != None and d["end"]],
-                            key=lambda x: x[1]["position"])
+        index = self._get_node_index()
+        positions = index["positions"]
 
-        posdict = OrderedDict()
-        for n in allPositionEnds:
-            if n[1]["position"] not in posdict:
-                posdict[n[1]["position"]] = [n]
-            else:
-                posdict[n[1]["position"]].append(n)
+        node = self.node
 
         aebp = []
-        for key in posdict:
-            posends = sorted(posdict[key], key=lambda x: x[1]["num"])
+        for position in range(index["max_position"] + 1):
+            posends = [n for n in positions.get(position, [])
+                       if node[n]["end"]]
+            if not posends:
+                continue
             if data:
-                aebp.append(posends)
+                aebp.append([(n, node[n]) for n in posends])
             else:
-                aebp.append([pe[0] for pe in posends])
+                aebp.append(posends)
 
         return aebp
 
@@ -827,12 +930,42 @@ class KnitNetworkBase(nx.Graph):
             The contour as a PolylineCurve if ``as_crv`` is ``True``.
         """
 
-        points = [n[1]["geo"] for n in self.nodes_on_position(position, True)]
+        node = self.node
+        points = [node[n]["geo"] for n in self.nodes_on_position(position)]
         Contour = RhinoPolyline(points)
         if as_crv:
             Contour = Contour.ToPolylineCurve()
         return Contour
 
+    def _polyline_length_at_position(self, position):
+        """
+        Computes the length of the contour polyline at a given position
+        directly from the node coordinates without creating any geometry.
+
+        Parameters
+        ----------
+        position : hashable
+            The index / identifier of the position
+
+        Returns
+        -------
+        length : float
+            The length of the contour polyline at the given position.
+        """
+
+        node = self.node
+        length = 0.0
+        prev = None
+        for n in self.nodes_on_position(position):
+            d = node[n]
+            if prev != None:
+                dx = d["x"] - prev["x"]
+                dy = d["y"] - prev["y"]
+                dz = d["z"] - prev["z"]
+                length += sqrt(dx * dx + dy * dy + dz * dz)
+            prev = d
+        return length
+
     def longest_position_contour(self):
         """
         Gets the longest contour 'position', geometry andgeometric length.
@@ -848,13 +981,17 @@ class KnitNetworkBase(nx.Graph):
         longestContour = None
         longestPosition = None
         for i in range(self.total_positions):
-            contour = self.geometry_at_position_contour(i, True)
-            cl = contour.GetLength()
+            cl = self._polyline_length_at_position(i)
             if cl > longestLength:
                 longestLength = cl
-                longestContour = contour.Duplicate()
                 longestPosition = i
-            contour.Dispose()
+
+        # only rebuild the geometry of the longest contour
+        if longestPosition != None:
+            longestContour = self.geometry_at_position_contour(
+                                                            longestPosition,
+                                                            True)
+
         return (longestPosition, longestContour, longestLength)
 
     # EDGE CREATION METHODS ---------------------------------------------------
@@ -883,6 +1020,8 @@ class KnitNetworkBase(nx.Graph):
         # get node indices
         fromNode = from_node[0]
         toNode = to_node[0]
+        if fromNode == None or toNode == None:
+            return False
 
         # get geometry from nodes
         fromGeo = from_node[1]["geo"]
@@ -897,10 +1036,7 @@ class KnitNetworkBase(nx.Graph):
                      "segment": None,
                      "geo": edgeGeo}
 
-        try:
-            self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
-        except Exception:
-            return False
+        self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
 
         return True
 
@@ -930,6 +1066,8 @@ class KnitNetworkBase(nx.Graph):
         # get node indices
         fromNode = from_node[0]
         toNode = to_node[0]
+        if fromNode == None or toNode == None:
+            return False
 
         # get geometry from nodes
         fromGeo = from_node[1]["geo"]
@@ -944,10 +1082,7 @@ class KnitNetworkBase(nx.Graph):
                      "segment": segment,
                      "geo": edgeGeo}
 
-        try:
-            self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
-        except Exception:
-            return False
+        self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
 
         return True
 
@@ -974,6 +1109,8 @@ class KnitNetworkBase(nx.Graph):
         # get node indices
         fromNode = from_node[0]
         toNode = to_node[0]
+        if fromNode == None or toNode == None:
+            return False
 
         # get geometry from nodes
         fromGeo = from_node[1]["geo"]
@@ -988,10 +1125,7 @@ class KnitNetworkBase(nx.Graph):
                      "segment": None,
                      "geo": edgeGeo}
 
-        try:
-            self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
-        except Exception:
-            return False
+        self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
 
         return True
 
@@ -1031,17 +1165,29 @@ class KnitNetworkBase(nx.Graph):
         # get node indices
         fromNode = from_node[0]
         toNode = to_node[0]
-
-        # join geo together
-        segment_geo = [RhinoLineCurve(ln) for ln in segment_geo]
-        edgeGeo = RhinoCurve.JoinCurves(segment_geo)
-        if len(edgeGeo) > 1:
-            errMsg = ("Segment geometry could not be joined into " +
-                      "one single curve for segment {}!".format(segment_value))
-            print(errMsg)
+        if fromNode == None or toNode == None:
             return False
 
-        edgeGeo = edgeGeo[0].ToPolyline()
+        if len(segment_geo) == 1:
+            # a single line needs no joining, build the polyline directly
+            segment_line = segment_geo[0]
+            edgeGeo = RhinoPolyline([segment_line.From, segment_line.To])
+        else:
+            # join geo together, handing a typed array to RhinoCommon so the
+            # curves do not have to be converted from a python list
+            segment_curves = Array.CreateInstance(RhinoCurve,
+                                                  len(segment_geo))
+            for i, ln in enumerate(segment_geo):
+                segment_curves[i] = RhinoLineCurve(ln)
+            edgeGeo = RhinoCurve.JoinCurves(segment_curves)
+            if len(edgeGeo) > 1:
+                errMsg = ("Segment geometry could not be joined into " +
+                          "one single curve for segment {}!".format(
+                              segment_value))
+                print(errMsg)
+                return False
+            edgeGeo = edgeGeo[0].ToPolyline()
+
         if not edgeGeo[0] == from_node[1]["geo"]:
             edgeGeo.Reverse()
 
@@ -1054,10 +1200,7 @@ class KnitNetworkBase(nx.Graph):
         self.add_node(fromNode, attr_dict=from_node[1])
         self.add_node(toNode, attr_dict=to_node[1])
 
-        try:
-            self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
-        except Exception:
-            return False
+        self.add_edge(fromNode, toNode, attr_dict=edgeAttrs)
 
         return True
 
@@ -1082,30 +1225,88 @@ class KnitNetworkBase(nx.Graph):
             2-tuple of (u, v) or (v, u) depending on the directions
         """
 
-        # get geometry data of the edge
-        edge_geo = self[u][v]["geo"]
+        # get geometry data of the edge and data of both nodes
+        edge_geo = self.adj[u][v]["geo"]
+        node = self.node
+        u_data = node[u]
+        v_data = node[v]
 
-        # compare start and endpoint and return nodes in order accordingly
-        if (edge_geo.From == self.node[u]["geo"]
-                and edge_geo.To == self.node[v]["geo"]):
+        # compare start and endpoint coordinates against the coordinates
+        # stored on the nodes and return nodes in order accordingly
+        if ((edge_geo.FromX, edge_geo.FromY, edge_geo.FromZ) ==
+                (u_data["x"], u_data["y"], u_data["z"])
+                and (edge_geo.ToX, edge_geo.ToY, edge_geo.ToZ) ==
+                (v_data["x"], v_data["y"], v_data["z"])):
             return (u, v)
         else:
             return (v, u)
 
     # EDGE PROPERTIES ---------------------------------------------------------
 
+    def _count_edge_types(self):
+        """
+        Counts the contour, 'weft' and 'warp' edges of the network in a
+        single pass over all edges.
+
+        Returns
+        -------
+        counts : :obj:`tuple` of :obj:`int`
+            3-tuple of the number of contour edges, 'weft' edges and 'warp'
+            edges.
+        """
+
+        ce = 0
+        wee = 0
+        wae = 0
+        for f, t, d in self.edges_iter(data=True):
+            weft = d["weft"]
+            warp = d["warp"]
+            if not weft and not warp:
+                ce += 1
+            elif weft and not warp:
+                wee += 1
+            elif warp and not weft:
+                wae += 1
+        return (ce, wee, wae)
+
+    def _edges_by_type(self):
+        """
+        Gets the contour, 'weft' and 'warp' edges of the network in a single
+        pass over all edges.
+
+        Returns
+        -------
+        edges : :obj:`tuple` of :obj:`list`
+            3-tuple of the lists of contour edges, 'weft' edges and 'warp'
+            edges. Every edge is a 3-tuple of (u, v, data) with u < v.
+        """
+
+        contour_edges = []
+        weft_edges = []
+        warp_edges = []
+        buckets = {(False, False): contour_edges,
+                   (True, False): weft_edges,
+                   (False, True): warp_edges}
+        for f, t, d in self.edges_iter(data=True):
+            bucket = buckets.get((bool(d["weft"]), bool(d["warp"])))
+            if bucket == None:
+                continue
+            if f > t:
+                bucket.append((t, f, d))
+            else:
+                bucket.append((f, t, d))
+        return (contour_edges, weft_edges, warp_edges)
+
     def _get_contour_edges(self):
         """
         Get all contour edges of the network that are neither 'weft' nor
         'warp'.
         """
 
-        contour_edges = [(f, t, d) for f, t, d in self.edges_iter(data=True)
-                         if not d["weft"] and not d["warp"]]
-        for i, ce in enumerate(contour_edges):
-            if ce[0] > ce[1]:
-                contour_edges[i] = (ce[1], ce[0], ce[2])
-        return contour_edges
+        # canonicalize the (u, v) order while filtering
+        return [(f, t, d) if f < t else (t, f, d)
+                for f, t, d in self.edges_iter(data=True)
+                if not d["weft"] and not d["warp"]]
 
     contour_edges = property(_get_contour_edges, None, None,
                              "The contour edges of the network marked " +
@@ -1116,12 +1317,10 @@ class KnitNetworkBase(nx.Graph):
         Get all 'weft' edges of the network.
         """
 
-        weft_edges = [(f, t, d) for f, t, d in self.edges_iter(data=True)
-                      if d["weft"] and not d["warp"]]
-        for i, we in enumerate(weft_edges):
-            if we[0] > we[1]:
-                weft_edges[i] = (we[1], we[0], we[2])
-        return weft_edges
+        # canonicalize the (u, v) order while filtering
+        return [(f, t, d) if f < t else (t, f, d)
+                for f, t, d in self.edges_iter(data=True)
+                if d["weft"] and not d["warp"]]
 
     weft_edges = property(_get_weft_edges, None, None,
                           "The edges of the network marked 'weft'.")
@@ -1131,12 +1330,10 @@ class KnitNetworkBase(nx.Graph):
         Get all 'warp' edges of the network.
         """
 
-        warp_edges = [(f, t, d) for f, t, d in self.edges_iter(data=True)
-                      if not d["weft"] and d["warp"]]
-        for i, we in enumerate(warp_edges):
-            if we[0] > we[1]:
-                warp_edges[i] = (we[1], we[0], we[2])
-        return warp_edges
+        # canonicalize the (u, v) order while filtering
+        return [(f, t, d) if f < t else (t, f, d)
+                for f, t, d in self.edges_iter(data=True)
+                if not d["weft"] and d["warp"]]
 
     warp_edges = property(_get_warp_edges, None, None,
                           "The edges of the network marked 'warp'.")
@@ -1148,21 +1345,17 @@ class KnitNetworkBase(nx.Graph):
         attribute.
         """
 
-        segment_contour_edges = [(f, t, d) for f, t, d
-                                 in self.edges_iter(data=True)
-                                 if not d["weft"] and
-                                 not d["warp"]]
-        segment_contour_edges = [sce for sce in segment_contour_edges
-                                 if sce[2]["segment"]]
-
-        for i, sce in enumerate(segment_contour_edges):
-            if sce[0] > sce[1]:
-                segment_contour_edges[i] = (sce[1], sce[0], sce[2])
+        # filter contour edges with a 'segment' attribute and decorate them
+        # with their 'segment' value as the sort key
+        decorated = [(d["segment"], f, t, d) for f, t, d
+                     in self.edges_iter(data=True)
+                     if not d["weft"] and not d["warp"] and d["segment"]]
 
         # sort them by their 'segment' attributes value
-        segment_contour_edges.sort(key=lambda x: x[2]["segment"])
+        decorated.sort(key=itemgetter(0))
 
-        return segment_contour_edges
+        return [(f, t, d) if f < t else (t, f, d)
+                for segment, f, t, d in decorated]
 
     segment_contour_edges = property(
                         _get_segment_contour_edges,
@@ -1198,13 +1391,11 @@ class KnitNetworkBase(nx.Graph):
             on the data parameter.
         """
 
-        weft_edges = [(s, e, d) for s, e, d in
-                      self.edges_iter(node, data=True) if d["weft"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return weft_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["weft"]]
         else:
-            return [(e[0], e[1]) for e in weft_edges]
+            return [(s, e) for s, e, d in edges_iter if d["weft"]]
 
     def node_warp_edges(self, node, data=False):
         """
@@ -1230,13 +1421,11 @@ class KnitNetworkBase(nx.Graph):
             on the data parameter.
         """
 
-        warp_edges = [(s, e, d) for s, e, d in
-                      self.edges_iter(node, data=True) if d["warp"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return warp_edges
+            return [(s, e, d) for s, e, d in edges_iter if d["warp"]]
         else:
-            return [(e[0], e[1]) for e in warp_edges]
+            return [(s, e) for s, e, d in edges_iter if d["warp"]]
 
     def node_contour_edges(self, node, data=False):
         """
@@ -1264,14 +1453,13 @@ class KnitNetworkBase(nx.Graph):
             attribute data of the edge, depending on the data parameter.
         """
 
-        contour_edges = [(s, e, d) for s, e, d in
-                         self.edges_iter(node, data=True)
-                         if not d["warp"] and not d["weft"]]
-
+        edges_iter = self.edges_iter(node, data=True)
         if data:
-            return contour_edges
+            return [(s, e, d) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
         else:
-            return [(e[0], e[1]) for e in contour_edges]
+            return [(s, e) for s, e, d in edges_iter
+                    if not d["warp"] and not d["weft"]]
 
     # SEGMENT CONTOUR END NODE METHODS ----------------------------------------
 
@@ -1300,20 +1488,19 @@ class KnitNetworkBase(nx.Graph):
             of the edge, depending on the data parameter.
         """
 
-        connected_segments = [(s, e, d) for s, e, d
+        # decorate the matching edges with their 'segment' value as the
+        # sort key
+        connected_segments = [(d["segment"], s, e, d) for s, e, d
                               in self.edges_iter(node, data=True) if
-                              not d["warp"] and not d["weft"]]
-        connected_segments = [cs for cs in connected_segments
-                              if cs[2]["segment"]]
-        connected_segments = [cs for cs in connected_segments
-                              if cs[2]["segment"][0] == node]
+                              not d["warp"] and not d["weft"] and
+                              d["segment"] and d["segment"][0] == node]
 
-        connected_segments.sort(key=lambda x: x[2]["segment"])
+        connected_segments.sort(key=itemgetter(0))
 
         if data:
-            return connected_segments
+            return [(s, e, d) for seg, s, e, d in connected_segments]
         else:
-            return [(cs[0], cs[1]) for cs in connected_segments]
+            return [(s, e) for seg, s, e, d in connected_segments]
 
     def end_node_segments_by_end(self, node, data=False):
         """
@@ -1340,20 +1527,59 @@ class KnitNetworkBase(nx.Graph):
             of the edge, depending on the data parameter.
         """
 
-        connected_segments = [(s, e, d) for s, e, d
+        # decorate the matching edges with their 'segment' value as the
+        # sort key
+        connected_segments = [(d["segment"], s, e, d) for s, e, d
                               in self.edges_iter(node, data=True) if
-                              not d["warp"] and not d["weft"]]
-        connected_segments = [cs for cs in connected_segments
-                              if cs[2]["segment"]]
-        connected_segments = [cs for cs in connected_segments
-                              if cs[2]["segment"][1] == node]
+                              not d["warp"] and not d["weft"] and
+                              d["segment"] and d["segment"][1] == node]
 
-        connected_segments.sort(key=lambda x: x[2]["segment"])
+        connected_segments.sort(key=itemgetter(0))
 
         if data:
-            return connected_segments
+            return [(s, e, d) for seg, s, e, d in connected_segments]
         else:
-            return [(cs[0], cs[1]) for cs in connected_segments]
+            return [(s, e) for seg, s, e, d in connected_segments]
+
+    def _end_node_segment_index(self):
+        """
+        Builds lookups of all the edges with a 'segment' attribute marked
+        neither 'weft' nor 'warp' by the 'end' nodes at the start and at the
+        end of their segment in a single pass over all edges.
+
+        Returns
+        -------
+        index : :obj:`tuple` of :obj:`dict`
+            2-tuple of dictionaries (by_start, by_end). Each maps a node
+            identifier to the list of edges that
+            :meth:`end_node_segments_by_start` or
+            :meth:`end_node_segments_by_end` respectively would return for that
+            node with ``data=True``.
+
+        Notes
+        -----
+        The lookups are a snapshot of the network and are not updated if
+        edges are added, removed or modified afterwards.
+        """
+
+        # decorate all segment contour edges with their 'segment' value and
+        # sort them once, so every bucket below is filled in sorted order
+        decorated = [(d["segment"], s, e, d) for s, e, d
+                     in self.edges_iter(data=True) if
+                     not d["warp"] and not d["weft"] and d["segment"]]
+        decorated.sort(key=itemgetter(0))
+
+        by_start = {}
+        by_end = {}
+        for segment, s, e, d in decorated:
+            for node, bucket in ((segment[0], by_start),
+                                 (segment[1], by_end)):
+                if s == node:
+                    bucket.setdefault(node, []).append((s, e, d))
+                elif e == node:
+                    bucket.setdefault(node, []).append((e, s, d))
+
+        return (by_start, by_end)
 
 # MAIN ------------------------------------------------------------------------
 
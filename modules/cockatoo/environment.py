@@ -29,9 +29,9 @@ from cockatoo.exception import NetworkXNotPresentError
 # CHECKING FOR RHINO DEPENDENCY AND ENVIRONMENT -------------------------------
 
 
-def is_rhino_inside():
+def _probe_rhino_inside():
     """
-    Check if Rhino is running using rhinoinside.
+    Probe the import of Rhino, loading it via rhinoinside if necessary.
 
     Returns
     -------
@@ -46,30 +46,53 @@ def is_rhino_inside():
     try:
         import Rhino
     except ImportError:
+        errMsg = ("Rhino could not be loaded! Please make sure the " +
+                  "RhinoCommon API is available to continue.")
         try:
             import rhinoinside
+        except ImportError:
+            raise RhinoNotPresentError(errMsg)
+        # rhinoinside depends on pythonnet, so System is available here and
+        # failures of loading RhinoCommon surface as .NET exceptions
+        from System import Exception as SystemException
+        try:
             rhinoinside.load()
             import Rhino  # NOQA: F401
-            return True
-        except Exception:
-            errMsg = ("Rhino could not be loaded! Please make sure the " +
-                      "RhinoCommon API is available to continue.")
+        except (ImportError, SystemException):
             raise RhinoNotPresentError(errMsg)
+        return True
     return False
 
 
-RHINOINSIDE = is_rhino_inside()
+RHINOINSIDE = _probe_rhino_inside()
 """
 bool: Will be ``True`` if Rhino is running using rhinoinside, ``False``
       otherwise.
 """
 
+
+def is_rhino_inside():
+    """
+    Check if Rhino is running using rhinoinside.
+
+    Returns
+    -------
+    bool
+        ``True`` if Rhino is running using rhinoinside, otherwise ``False``.
+
+    Notes
+    -----
+    Rhino is only probed once when this module is imported, this function
+    returns the result of that probe.
+    """
+    return RHINOINSIDE
+
 # CHECKING FOR NETWORKX DEPENDENCY AND VERSION --------------------------------
 
 
-def networkx_version():
+def _probe_networkx_version():
     """
-    Return the version of the used networkx module.
+    Probe the import of networkx and return its version.
 
     Returns
     -------
@@ -92,11 +115,28 @@ def networkx_version():
     return version
 
 
-NXVERSION = networkx_version()
+NXVERSION = _probe_networkx_version()
 """
 str: The version string of the networkx module that is being used.
 """
 
+
+def networkx_version():
+    """
+    Return the version of the used networkx module.
+
+    Returns
+    -------
+    str
+        The version string of the used networkx module.
+
+    Notes
+    -----
+    NetworkX is only probed once when this module is imported, this function
+    returns the result of that probe.
+    """
+    return NXVERSION
+
 # MAIN ------------------------------------------------------------------------
 
 
@@ -42,44 +42,62 @@ __all__ = [
 class CockatooException(Exception):
     """Base class for exceptions in Cockatoo."""
 
+    __slots__ = ()
+
 
 class CockatooImportException(ImportError):
     """Base class for import errors in Cockatoo."""
 
+    __slots__ = ()
+
 # DEPENDENCY EXCEPTIONS -------------------------------------------------------
 
 
 class RhinoNotPresentError(CockatooImportException):
     """Exception raised when import of Rhino fails."""
 
+    __slots__ = ()
+
 
 class SystemNotPresentError(CockatooImportException):
     """Exception raised when import of System fails."""
 
+    __slots__ = ()
+
 
 class NetworkXNotPresentError(CockatooImportException):
     """Exception raised when import of NetworkX fails."""
 
+    __slots__ = ()
+
 
 class NetworkXVersionError(CockatooException):
     """Exception raised when NetworkX version is not 1.5."""
 
+    __slots__ = ()
+
 # CALLBACK EXCEPTIONS ---------------------------------------------------------
 
 
 class CockatooCallbackError(CockatooException):
     """Exception raised when a supplied callback is not callable."""
 
+    __slots__ = ()
+
 # KNITNETWORK EXCEPTIONS ------------------------------------------------------
 
 
 class KnitNetworkError(CockatooException):
     """Exception for a serious error in a KnitNetwork of Cockatoo."""
 
+    __slots__ = ()
+
 
 class KnitNetworkGeometryError(KnitNetworkError):
     """Exception raised when vital geometry operations fail."""
 
+    __slots__ = ()
+
 
 class MappingNetworkError(KnitNetworkError):
     """
@@ -87,6 +105,8 @@ class MappingNetworkError(KnitNetworkError):
     network has been assigned to the current KnitNetwork instance yet.
     """
 
+    __slots__ = ()
+
 
 class KnitNetworkTopologyError(KnitNetworkError):
     """
@@ -94,6 +114,8 @@ class KnitNetworkTopologyError(KnitNetworkError):
     if that topology could not be verified.
     """
 
+    __slots__ = ()
+
 
 class NoWeftEdgesError(KnitNetworkError):
     """
@@ -101,6 +123,8 @@ class NoWeftEdgesError(KnitNetworkError):
     edges in the network.
     """
 
+    __slots__ = ()
+
 
 class NoWarpEdgesError(KnitNetworkError):
     """
@@ -108,6 +132,8 @@ class NoWarpEdgesError(KnitNetworkError):
     edges in the network.
     """
 
+    __slots__ = ()
+
 
 class NoEndNodesError(KnitNetworkError):
     """
@@ -115,6 +141,8 @@ class NoEndNodesError(KnitNetworkError):
     nodes in the network.
     """
 
+    __slots__ = ()
+
 # MAIN ------------------------------------------------------------------------
 
 
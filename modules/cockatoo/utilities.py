@@ -9,6 +9,8 @@
     map_values_as_colors
     tween_planes
     is_ccw_xy
+    is_ccw_xy_strict
+    is_ccw_xy_colinear
     resolve_order_by_backtracking
 """
 
@@ -18,10 +20,52 @@ from __future__ import division
 from __future__ import print_function
 from collections import deque
 from itertools import tee
-from math import cos
-from math import pi
+from math import acos
+from math import atan2
 from math import sqrt
 
+# use the native implementation of pairwise where it is available (Python
+# 3.10+) and fall back to the itertools recipe otherwise
+try:
+    from itertools import pairwise
+except ImportError:
+    def pairwise(iterable):
+        """
+        Returns the data of iterable in pairs (2-tuples).
+
+        Parameters
+        ----------
+        iterable : iterable
+            An iterable sequence of items.
+
+        Yields
+        ------
+        tuple
+            Two items per iteration, if there are at least two items in the
+            iterable.
+
+        Examples
+        --------
+        >>> print(list(pairwise(range(4))))
+        ...
+        [(0, 1), (1, 2), (2, 3)]
+
+        Notes
+        -----
+        For more info see [16]_ .
+
+        References
+        ----------
+        .. [16] Python itertools Recipes
+
+               See: `Python itertools Recipes <https://docs.python.org/2.7/
+               library/itertools.html#recipes>`_
+
+        """
+        a, b = tee(iterable)
+        next(b, None)
+        return zip(a, b)
+
 # DUNDER ----------------------------------------------------------------------
 __all__ = [
     "blend_colors",
@@ -29,31 +73,40 @@ __all__ = [
     "map_values_as_colors",
     "tween_planes",
     "is_ccw_xy",
+    "is_ccw_xy_strict",
+    "is_ccw_xy_colinear",
     "resolve_order_by_backtracking",
     "pairwise"
 ]
 
 # LOCAL MODULE IMPORTS --------------------------------------------------------
-from cockatoo.environment import RHINOINSIDE
-from cockatoo.exception import SystemNotPresentError
+from cockatoo.environment import RHINOINSIDE  # NOQA: F401
 
 # RHINO IMPORTS ---------------------------------------------------------------
-if RHINOINSIDE:
-    import rhinoinside
-    rhinoinside.load()
-    from Rhino.Display import ColorHSL as RhinoColorHSL
-    from Rhino.Geometry import Polyline as RhinoPolyline
-    from Rhino.Geometry import Quaternion as RhinoQuaternion
-    from Rhino.Geometry import Vector3d as RhinoVector3d
-else:
-    from Rhino.Display import ColorHSL as RhinoColorHSL
-    from Rhino.Geometry import Polyline as RhinoPolyline
-    from Rhino.Geometry import Quaternion as RhinoQuaternion
-    from Rhino.Geometry import Vector3d as RhinoVector3d
+# rhinoinside has already been loaded by cockatoo.environment if needed
+from Rhino.Display import ColorHSL as RhinoColorHSL
+from Rhino.Geometry import Polyline as RhinoPolyline
+from Rhino.Geometry import Quaternion as RhinoQuaternion
+from Rhino.Geometry import Vector3d as RhinoVector3d
 
 # RHINO GEOMETRY --------------------------------------------------------------
 
 
+def _unit_direction(line):
+    """
+    Returns the unitized direction of a line as a 3-tuple of floats computed
+    from its endpoint coordinates. Degenerate lines yield a zero vector.
+    """
+
+    dx = line.ToX - line.FromX
+    dy = line.ToY - line.FromY
+    dz = line.ToZ - line.FromZ
+    length = sqrt(dx * dx + dy * dy + dz * dz)
+    if length > 0:
+        return (dx / length, dy / length, dz / length)
+    return (0.0, 0.0, 0.0)
+
+
 def break_polyline(polyline, break_angle, as_crv=False):
     """
     Breaks a polyline at kinks based on a specified angle. Will move the seam
@@ -83,8 +136,14 @@ def break_polyline(polyline, break_angle, as_crv=False):
 
     """
 
-    # get all the polyline segments
-    segments = deque(polyline.GetSegments())
+    # get all the polyline segments. they are walked as a ring buffer where
+    # i points at the first remaining segment. segments are only ever
+    # consumed at the front of the remaining ones, and the ring is only
+    # rotated while no segment has been consumed yet
+    segments = list(polyline.GetSegments())
+    segment_count = len(segments)
+    remaining = segment_count
+    i = 0
 
     # check if polyline in closed
     if polyline.IsClosed:
@@ -96,43 +155,63 @@ def break_polyline(polyline, break_angle, as_crv=False):
     plcs = []
     pl = RhinoPolyline()
 
+    # unitized direction of the first segment. the next segment becomes the
+    # first one in almost every step, so its direction is carried over
+    thisdir = None
+
     # process all segments
-    while len(segments) > 0:
+    while remaining > 0:
         # if there is only one segment left, add the endpoint to the new pl
-        if len(segments) == 1:
-            ln = segments.popleft()
+        if remaining == 1:
+            ln = segments[i]
             pl.Add(ln.To)
             plcs.append(pl)
             break
 
-        # get unitized directions of this and next segment
-        thisdir = segments[0].Direction
-        nextdir = segments[1].Direction
-        thisdir.Unitize()
-        nextdir.Unitize()
-
-        # compute angle
-        vdp = thisdir * nextdir
-        angle = cos(vdp / (thisdir.Length * nextdir.Length))
-        angle = RhinoVector3d.VectorAngle(thisdir, nextdir)
+        # index of the next segment
+        j = (i + 1) % segment_count
 
-        # check angles and execute breaks
+        # get unitized directions of this and next segment
+        if thisdir is None:
+            thisdir = _unit_direction(segments[i])
+        nextdir = _unit_direction(segments[j])
+
+        # compute angle from the dot product of the unitized directions
+        vdp = (thisdir[0] * nextdir[0] +
+               thisdir[1] * nextdir[1] +
+               thisdir[2] * nextdir[2])
+        if vdp > 1.0:
+            vdp = 1.0
+        elif vdp < -1.0:
+            vdp = -1.0
+        angle = acos(vdp)
+        thisdir = nextdir
+
+        # check angles and execute breaks. advancing i either rotates the
+        # ring or consumes the first remaining segment
         if angle >= break_angle:
             if not closedSeamAtKink:
-                segments.rotate(-1)
-                pl.Add(segments.popleft().From)
+                # rotate and consume the next segment as well
+                pl.Add(segments[j].From)
+                i = (j + 1) % segment_count
+                remaining -= 1
                 closedSeamAtKink = True
+                thisdir = None
             elif closedSeamAtKink:
-                ln = segments.popleft()
+                ln = segments[i]
+                i = j
+                remaining -= 1
                 pl.Add(ln.From)
                 pl.Add(ln.To)
                 plcs.append(pl)
                 pl = RhinoPolyline()
         else:
             if not closedSeamAtKink:
-                segments.rotate(-1)
+                i = j
             else:
-                pl.Add(segments.popleft().From)
+                pl.Add(segments[i].From)
+                i = j
+                remaining -= 1
 
     if as_crv:
         return [pline.ToPolylineCurve() for pline in plcs]
@@ -162,11 +241,6 @@ def tween_planes(pa, pb, t):
     tweened_plane : :obj:`Rhino.Geometry.Plane`
         The plane between ``pa`` and ``pb`` at parameter ``t``.
 
-    Raises
-    ------
-    SystemNotPresentError
-        If the ``System`` module cannot be imported.
-
     References
     ----------
     .. [19] *Average between two planes*
@@ -175,29 +249,33 @@ def tween_planes(pa, pb, t):
             t/average-between-two-planes/71363/10>`_
     """
 
-    # handle dotnet dependency in a nice way
-    try:
-        from clr import Reference
-        from System import Double
-    except ImportError:
-        errMsg = "Could not import System. This function cannot execute!"
-        raise SystemNotPresentError(errMsg)
+    # the end planes need no interpolation at all
+    if t == 0:
+        return pa.Clone()
+    elif t == 1:
+        return pb.Clone()
 
     # create the quternion rotation between the two input planes
     Q = RhinoQuaternion.Rotation(pa, pb)
 
-    # prepare out parameters
-    qAngle = Reference[Double]()
-    qAxis = Reference[RhinoVector3d]()
+    # read the components of the unit quaternion once. if the scalar part is
+    # negative, the negated quaternion describes the same rotation along the
+    # shorter path, which is what interpolation needs
+    qa, qb, qc, qd = Q.A, Q.B, Q.C, Q.D
+    if qa < 0:
+        qa, qb, qc, qd = -qa, -qb, -qc, -qd
 
-    # get the rotation of the quaternion
-    Q.GetRotation(qAngle, qAxis)
-
-    axis = RhinoVector3d(qAxis.X, qAxis.Y, qAxis.Z)
-    angle = float(qAngle) - 2 * pi if float(qAngle) > pi else float(qAngle)
+    # get angle and axis of the rotation directly from the components
+    # instead of through the out parameters of Quaternion.GetRotation.
+    # atan2 stays accurate for nearly identical planes, where acos of a
+    # scalar part close to 1 loses precision
+    sin_half = sqrt(qb * qb + qc * qc + qd * qd)
 
     out_plane = pa.Clone()
-    out_plane.Rotate(t * angle, axis, out_plane.Origin)
+    if sin_half > 0:
+        angle = 2 * atan2(sin_half, qa)
+        axis = RhinoVector3d(qb / sin_half, qc / sin_half, qd / sin_half)
+        out_plane.Rotate(t * angle, axis, out_plane.Origin)
     translation = RhinoVector3d(pb.Origin - pa.Origin)
     out_plane.Translate(translation * t)
 
@@ -248,9 +326,10 @@ def blend_colors(col_a, col_b, t=0.5):
     b_r, b_g, b_b = col_b
 
     # compute the new rgb values for the blended color
-    new_r = sqrt((1 - t) * a_r ** 2 + t * b_r ** 2)
-    new_g = sqrt((1 - t) * a_g ** 2 + t * b_g ** 2)
-    new_b = sqrt((1 - t) * a_b ** 2 + t * b_b ** 2)
+    u = 1 - t
+    new_r = sqrt(u * a_r * a_r + t * b_r * b_r)
+    new_g = sqrt(u * a_g * a_g + t * b_g * b_g)
+    new_b = sqrt(u * a_b * a_b + t * b_b * b_b)
 
     # return the new color tuple
     return (new_r, new_g, new_b)
@@ -304,78 +383,32 @@ def map_values_as_colors(values, src_min, src_max,
             AndersDeleuran/82fa2a8a69ec10ac68176e1b848fdeea>`_
     """
 
-    # remap numbers into new numeric domain
-    remapped_values = []
-    for v in values:
-        if src_max - src_min > 0:
-            rv = ((v - src_min) / (src_max - src_min)) \
-                 * (target_max - target_min) \
-                 + target_min
-        else:
-            rv = (target_min + target_max) / 2
-        remapped_values.append(rv)
-
-    # make rgb colors and return
-    colors = []
-    for v in remapped_values:
-        c = RhinoColorHSL(v, 1.0, 0.5).ToArgbColor()
-        colors.append(c)
-
-    return colors
-
-# FUNCTIONAL GRAPH UTILITIES --------------------------------------------------
-
-
-def _backtrack_node(G, node, pos, ordered_stack):
-    """
-    Backtracks a node until no new predecessors are found and
-    inserts the node and all dependencies in order into the
-    ordered stack list.
-    """
-
-    # check the node for dependencies
-    dependencies = [pred for pred in G.predecessors_iter(node)
-                    if pred not in ordered_stack]
-
-    # if node has no dependencies that are not already in the stack,
-    # insert into the ordered stack of nodes and increment the pointer
-    if not dependencies:
-        if node not in ordered_stack:
-            ordered_stack.insert(pos, node)
-            pos += 1
-            return pos, ordered_stack
+    # remap numbers into new numeric domain, the domain check does not
+    # depend on the values so it is done only once
+    if src_max - src_min > 0:
+        scale = (target_max - target_min) / (src_max - src_min)
+        remapped_values = [(v - src_min) * scale + target_min
+                           for v in values]
     else:
-        # if node has dependencies, build a local stack of dependencies
-        dependencies = deque(dependencies)
-
-        # backtrack all dependencies
-        while len(dependencies) > 0:
-            dependency = dependencies.pop()
-            pos, ordered_stack = _backtrack_node(G,
-                                                 dependency,
-                                                 pos,
-                                                 ordered_stack)
+        rv = (target_min + target_max) / 2
+        remapped_values = [rv for v in values]
 
-            # after all its dependencies are solved, insert the
-            # dependent node at the current pointer position
-            if dependency not in ordered_stack:
-                ordered_stack.insert(pos, dependency)
-                pos += 1
+    # make rgb colors only once for every distinct hue and return
+    hue_colors = dict((v, RhinoColorHSL(v, 1.0, 0.5).ToArgbColor())
+                      for v in set(remapped_values))
+    return [hue_colors[v] for v in remapped_values]
 
-        # after dependencies and sub-dependencies are solved, insert the node
-        ordered_stack.insert(pos, node)
-        pos += 1
-
-    # return the current pos and the filled ordered stack
-    return pos, ordered_stack
+# FUNCTIONAL GRAPH UTILITIES --------------------------------------------------
 
 
 def resolve_order_by_backtracking(G):
     """
-    Resolve topological order of a networkx DiGraph through backtracking of
-    all nodes in the graph. Nodes are only inserted into the output list if
-    all their dependencies (predecessor nodes) are already inside the output
-    list, otherwise the algorithm will first resolve all open dependencies.
+    Resolve topological order of a networkx DiGraph by resolving the
+    dependencies of all nodes in the graph. Nodes are only inserted into the
+    output list if all their dependencies (predecessor nodes) are already
+    inside the output list. Starting from the nodes without dependencies, the
+    nodes whose dependencies have all been resolved are inserted in turn
+    (Kahn's algorithm).
 
     Parameters
     ----------
@@ -391,6 +424,8 @@ def resolve_order_by_backtracking(G):
     ------
     ValueError
         If the input graph is not directed.
+    ValueError
+        If the input graph contains a cycle.
 
     Warning
     -------
@@ -413,21 +448,33 @@ def resolve_order_by_backtracking(G):
     if not G.is_directed():
         raise ValueError("This works only on directed graphs!")
 
-    # stack is every node that has not been inserted yet
-    stack = deque(G.nodes())
-    # pos is the current pointer for insertion
-    pos = 0
+    # bind the adjacencies of the graph once
+    pred = G.pred
+    succ = G.succ
+
+    # count the open dependencies (predecessor nodes) of every node and seed
+    # the queue of resolvable nodes with all nodes that have none
+    open_dependencies = dict((node, len(pred[node])) for node in G.nodes())
+    ready = deque(node for node, count in open_dependencies.items()
+                  if count == 0)
+
     # ordered stack is the target list for insertion
     ordered_stack = []
-    # backtrack the whole stack
-    while len(stack) > 0:
-        # pop an arbitrary node from the stack
-        current_node = stack.pop()
-        # backtrack that node and resolve all its dependencies
-        pos, ordered_stack = _backtrack_node(G,
-                                             current_node,
-                                             pos,
-                                             ordered_stack)
+    while len(ready) > 0:
+        # every node in the queue has all its dependencies resolved
+        node = ready.popleft()
+        ordered_stack.append(node)
+        # resolve this dependency for all dependent nodes and queue those
+        # which have no open dependencies left
+        for dependent in succ[node]:
+            open_dependencies[dependent] -= 1
+            if open_dependencies[dependent] == 0:
+                ready.append(dependent)
+
+    # nodes on a cycle never run out of open dependencies
+    if len(ordered_stack) != len(open_dependencies):
+        raise ValueError("The input graph contains a cycle!")
+
     # return the ordered stack
     return ordered_stack
 
@@ -489,51 +536,58 @@ def is_ccw_xy(a, b, c, colinear=False):
     True
     """
 
-    ab_x = b[0] - a[0]
-    ab_y = b[1] - a[1]
-    ac_x = c[0] - a[0]
-    ac_y = c[1] - a[1]
-
     if colinear:
-        return ab_x * ac_y - ab_y * ac_x >= 0
-    return ab_x * ac_y - ab_y * ac_x > 0
-
-# PYTHON HELPERS AND UTILITIES ------------------------------------------------
+        return is_ccw_xy_colinear(a, b, c)
+    return is_ccw_xy_strict(a, b, c)
 
 
-def pairwise(iterable):
+def is_ccw_xy_strict(a, b, c):
     """
-    Returns the data of iterable in pairs (2-tuples).
+    Determine if c is strictly on the left of ab when looking from a to b,
+    and assuming that all points lie in the XY plane. Equivalent to
+    :func:`is_ccw_xy` with ``colinear=False``, meant to be bound directly
+    when testing many points in a loop.
 
     Parameters
     ----------
-    iterable : iterable
-        An iterable sequence of items.
+    a : sequence of float
+        XY(Z) coordinates of the base point.
+    b : sequence of float
+        XY(Z) coordinates of the first end point.
+    c : sequence of float
+        XY(Z) coordinates of the second end point.
 
-    Yields
-    ------
-    tuple
-        Two items per iteration, if there are at least two items in the
-        iterable.
+    Returns
+    -------
+    bool
+        ``True`` if ccw.
+        ``False`` otherwise.
+    """
 
-    Examples
-    --------
-    >>> print(pairwise(range(4))):
-    ...
-    [(0, 1), (1, 2), (2, 3)]
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) > 0
 
-    Notes
-    -----
-    For more info see [16]_ .
 
-    References
-    ----------
-    .. [16] Python itertools Recipes
+def is_ccw_xy_colinear(a, b, c):
+    """
+    Determine if c is on the left of ab or on ab when looking from a to b,
+    and assuming that all points lie in the XY plane. Equivalent to
+    :func:`is_ccw_xy` with ``colinear=True``, meant to be bound directly
+    when testing many points in a loop.
 
-           See: `Python itertools Recipes <https://docs.python.org/2.7/
-           library/itertools.html#recipes>`_
+    Parameters
+    ----------
+    a : sequence of float
+        XY(Z) coordinates of the base point.
+    b : sequence of float
+        XY(Z) coordinates of the first end point.
+    c : sequence of float
+        XY(Z) coordinates of the second end point.
 
+    Returns
+    -------
+    bool
+        ``True`` if ccw or colinear.
+        ``False`` otherwise.
     """
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) >= 0